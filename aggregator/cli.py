@@ -9,7 +9,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from .config import load_config
+from .config import Config, load_config
 from .download import download_sources
 from .normalize import normalize_sources
 from .dedupe import deduplicate_sources
@@ -19,6 +19,11 @@ app = typer.Typer(help="aggregator Nickname - Agrégateur de pseudos, prénoms e
 console = Console()
 
 
+def _with_force(config: Config) -> Config:
+    """Renvoie une copie de la configuration (immuable) avec defaults.force activé."""
+    return config.model_copy(update={"defaults": config.defaults.model_copy(update={"force": True})})
+
+
 @app.command()
 def run(
     config_path: str = typer.Option("config.yaml", "--config", "-c", help="Chemin vers le fichier de configuration"),
@@ -36,7 +41,7 @@ def run(
     try:
         config = load_config(config_path)
         if force:
-            config.defaults.force = True
+            config = _with_force(config)
     except Exception as e:
         console.print(f"[bold red]Erreur lors du chargement de la configuration: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -79,7 +84,7 @@ def download(
     try:
         config = load_config(config_path)
         if force:
-            config.defaults.force = True
+            config = _with_force(config)
     except Exception as e:
         console.print(f"[bold red]Erreur lors du chargement de la configuration: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -109,7 +114,7 @@ def normalize(
     try:
         config = load_config(config_path)
         if force:
-            config.defaults.force = True
+            config = _with_force(config)
     except Exception as e:
         console.print(f"[bold red]Erreur lors du chargement de la configuration: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -143,7 +148,7 @@ def dedupe(
     try:
         config = load_config(config_path)
         if force:
-            config.defaults.force = True
+            config = _with_force(config)
     except Exception as e:
         console.print(f"[bold red]Erreur lors du chargement de la configuration: {e}[/bold red]")
         raise typer.Exit(code=1)
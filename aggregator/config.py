@@ -3,12 +3,15 @@ Module de configuration pour aggregator Nickname.
 Définit les modèles Pydantic pour la validation des configurations.
 """
 
-from typing import Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, HttpUrl
+import os
+from typing import Dict, List, Literal, Optional, TextIO, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class Source(BaseModel):
     """Modèle pour une source de données."""
+    model_config = ConfigDict(frozen=True)
+
     slug: str = Field(..., description="Identifiant unique de la source")
     type: Literal["git", "kaggle", "wikidata", "http", "local"] = Field(
         ..., description="Type de source"
@@ -21,40 +24,76 @@ class Source(BaseModel):
     is_email: Optional[bool] = Field(False, description="Indique si la source contient des emails")
     path: Optional[str] = Field(None, description="Chemin spécifique dans le dépôt")
 
+    @field_validator("url", mode="after")
+    @classmethod
+    def _url_as_str(cls, url: Optional[HttpUrl]) -> Optional[str]:
+        """L'URL est validée comme HttpUrl puis conservée en str, comme l'attendent les tests et le téléchargeur."""
+        return str(url) if url is not None else None
+
 
 class Defaults(BaseModel):
     """Paramètres par défaut pour l'application."""
+    model_config = ConfigDict(frozen=True)
+
     cache_dir: str = Field("data/raw", description="Répertoire de cache pour les données brutes")
     force: bool = Field(False, description="Forcer le téléchargement même si le cache existe")
     workers: int = Field(32, description="Nombre de workers pour les opérations asynchrones")
     data_file_exts: List[str] = Field(default_factory=lambda: ['.txt', '.csv', '.parquet', '.json', '.tsv'], description="Extensions de fichiers de données valides (avec le point)")
+    max_concurrent_downloads: int = Field(8, description="Nombre maximal de sources téléchargées en parallèle")
+    cleanup_concurrency: Optional[int] = Field(None, description="Nombre de suppressions parallèles lors du nettoyage (None = détection automatique selon le système de fichiers)")
 
 
 class Config(BaseModel):
     """Configuration globale de l'application."""
+    model_config = ConfigDict(frozen=True)
+
     sources: List[Source] = Field(..., description="Liste des sources de données")
     defaults: Defaults = Field(default_factory=Defaults, description="Paramètres par défaut")
 
 
-def load_config(config_path: str) -> Config:
+# Configurations déjà chargées, indexées par (chemin absolu, mtime en ns, taille) du fichier
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Config] = {}
+
+
+def load_config(config_path: Union[str, TextIO]) -> Config:
     """
     Charge la configuration depuis un fichier YAML.
+    Le fichier n'est relu et validé que s'il a changé (date de modification ou taille) depuis le
+    dernier chargement ; les modèles étant immuables, la même instance est partagée entre les appels.
+    Un flux texte déjà ouvert (ex. io.StringIO) est lu et validé directement, sans cache.
     
     Args:
-        config_path: Chemin vers le fichier de configuration YAML
+        config_path: Chemin vers le fichier de configuration YAML, ou flux texte YAML
+        
+    Returns:
+        Config: Configuration validée
+    """
+    if hasattr(config_path, "read"):
+        return _parse_config(config_path)
+    st = os.stat(config_path)
+    key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = _CONFIG_CACHE[key] = _parse_config(f)
+    return config
+
+
+def _parse_config(stream: TextIO) -> Config:
+    """
+    Lit et valide un flux YAML de configuration, sans cache.
+    
+    Args:
+        stream: Flux texte contenant la configuration YAML
         
     Returns:
         Config: Configuration validée
     """
     import yaml
     
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+    # Chargeur C de PyYAML (libyaml) s'il est disponible, bien plus rapide que le chargeur Python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    config_data = yaml.load(stream, Loader=loader)
     
-    # Créer l'instance de Config
-    config = Config(**config_data)
-    # Convertir les URLs en str pour correspondre aux attentes des tests
-    for src in config.sources:
-        if src.url is not None:
-            src.url = str(src.url)
-    return config
+    # Créer l'instance de Config (les URLs sont converties en str pendant la validation)
+    return Config(**config_data)
@@ -5,7 +5,7 @@ Gère la déduplication des données normalisées.
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import polars as pl
 from rich.console import Console
@@ -172,7 +172,7 @@ def deduplicate_sources(config_path: str, normalized_paths: Dict[str, Path], hig
 
 
 # Déduplication séquentielle des chunks de texte brut
-def deduplicate_chunks(chunk_dir: Path, output_path: Path, console: Console = None) -> Path:
+def deduplicate_chunks(chunk_dir: Path, output_path: Path, console: Console = None) -> Tuple[Path, int]:
     """
     Déduplique séquentiellement les fichiers chunk_XXX.txt dans chunk_dir.
     Args:
@@ -180,7 +180,7 @@ def deduplicate_chunks(chunk_dir: Path, output_path: Path, console: Console = No
         output_path: Fichier de sortie sans doublon
         console: Console Rich pour l'affichage des logs
     Returns:
-        Path: Chemin vers le fichier résultant sans doublon
+        Tuple[Path, int]: Chemin vers le fichier résultant sans doublon et nombre d'entrées uniques écrites
     """
     seen = set()
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -196,4 +196,4 @@ def deduplicate_chunks(chunk_dir: Path, output_path: Path, console: Console = No
                         out_f.write(line)
     if console:
         console.print(f"[green]✓ Déduplication des chunks terminée. Entrées uniques: {len(seen)}[/green]")
-    return output_path
+    return output_path, len(seen)
@@ -24,6 +24,14 @@ from rich.console import Console
 from .config import Config, Source
 from .utils import has_valid_data_files
 
+# Extensions connues pour être binaires
+BINARY_EXTENSIONS = frozenset({
+    '.zip', '.rar', '.gz', '.tar', '.7z', '.exe', '.bin', '.dat', 
+    '.pdf', '.png', '.jpg', '.jpeg', '.gif', '.mp3', '.mp4', '.avi',
+    '.mov', '.mkv', '.iso', '.dll', '.so', '.dylib', '.jar',
+    '.class', '.pyc', '.pyd', '.obj', '.o', '.lib', '.a'
+})
+
 class Downloader:
     """Gestionnaire de téléchargement asynchrone pour les sources de données."""
 
@@ -142,8 +150,9 @@ class Downloader:
             cache_path = self.cache_dir / source.slug
             
             # Vérification du cache avec extensions personnalisables
+            # (parcours disque dans un thread : les vérifications des sources téléchargées en parallèle se chevauchent)
             if cache_path.exists() and not self.force:
-                has_valid_data = has_valid_data_files(cache_path, self.data_file_exts)
+                has_valid_data = await asyncio.to_thread(has_valid_data_files, cache_path, self.data_file_exts)
                 if has_valid_data:
                     if interactive:
                         # Interaction utilisateur pour forcer ou non le téléchargement
@@ -151,7 +160,7 @@ class Downloader:
                             choix = input(f"[INTERACTIF] Un cache valide existe pour {source.slug}. Voulez-vous forcer le téléchargement ? (o/N) : ").strip().lower()
                         except Exception:
                             choix = ""
-                        if choix == "o":
+                        if choix in ("o", "oui", "y", "yes"):
                             print(f"Téléchargement forcé pour {source.slug} malgré un cache valide.")
                         else:
                             print(f"Utilisation du cache existant pour {source.slug} (au moins un fichier de données détecté)")
@@ -558,16 +567,8 @@ def is_binary_file(file_path: Path) -> bool:
     Returns:
         bool: True si le fichier est binaire, False s'il est texte
     """
-    # Liste des extensions connues pour être binaires
-    binary_exts = {
-        '.zip', '.rar', '.gz', '.tar', '.7z', '.exe', '.bin', '.dat', 
-        '.pdf', '.png', '.jpg', '.jpeg', '.gif', '.mp3', '.mp4', '.avi',
-        '.mov', '.mkv', '.iso', '.dll', '.so', '.dylib', '.jar',
-        '.class', '.pyc', '.pyd', '.obj', '.o', '.lib', '.a'
-    }
-    
     # Vérifier l'extension en premier
-    if file_path.suffix.lower() in binary_exts:
+    if file_path.suffix.lower() in BINARY_EXTENSIONS:
         return True
         
     # Utiliser les types MIME si possible
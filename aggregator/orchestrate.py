@@ -39,14 +39,13 @@ def dedupe_chunks_cli(
         orchestrator.console.print("[yellow]Aucun chunk à dédupliquer. Veuillez d'abord scinder les fichiers bruts en chunks.[/yellow]")
         raise typer.Exit()
     # Appel de la déduplication séquentielle
-    final = deduplicate_chunks(
+    final, count = deduplicate_chunks(
         split_dir,
         orchestrator.deduped_dir / "deduped_chunks.txt",
         orchestrator.console
     )
     orchestrator.console.print(f"[green]Fichier dédupliqué généré : {final}[/green]")
     # Nombre de lignes uniques
-    count = sum(1 for _ in open(final, "r", encoding="utf-8"))
     orchestrator.console.print(f"[green]Total lignes uniques : {count}[/green]")
 
 
@@ -6,11 +6,12 @@ Contient la classe principale OrchestratorBase qui initialise les chemins et la
 import os
 from pathlib import Path
 from rich.console import Console
-from typing import Dict, Any, List
+from typing import List
 
 # Imports absolus pour éviter les problèmes de résolution
 from aggregator.config import load_config
 from aggregator.logger import setup_logger
+from aggregator.orchestration.error_handling import ErrorEntry
 
 
 class OrchestratorBase:
@@ -27,7 +28,7 @@ class OrchestratorBase:
         self.console = Console()
         
         # Initialiser le log d'erreurs
-        self.errors_log: List[Dict[str, Any]] = []
+        self.errors_log: List[ErrorEntry] = []
         
         # Vérifier si le fichier de configuration existe
         if not os.path.exists(config_path):
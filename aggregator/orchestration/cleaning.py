@@ -3,27 +3,337 @@ Module de nettoyage pour l'orchestrateur d'aggregator Nickname.
 Contient toutes les fonctions liées au nettoyage des fichiers et répertoires.
 """
 
+import asyncio
+import errno
+import functools
 import os
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import stat
+import sys
 import random
 import time
 import shutil
+import tempfile
 from pathlib import Path
 from contextlib import suppress
-from typing import Optional, Union, Dict, List
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+from typing import Any, Callable, Optional, Union, Dict, List, Iterable, Iterator, Collection, Tuple
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TaskID
 # Ce mixin est utilisé avec OrchestratorBase mais n'en hérite pas directement
 from rich.console import Console
 
+from ..config import Config
 # Importer les décorateurs de gestion d'erreurs
 from .error_handling import log_errors, capture_errors  # type: ignore
 
 
+# Types de systèmes de fichiers réseau sur lesquels les suppressions parallèles ralentissent
+NETWORK_FSTYPES = ('nfs', 'cifs', 'smb', 'fuse.sshfs')
+# Profondeur d'I/O au-delà de laquelle les SSD saturent
+DEFAULT_CLEANUP_WIDTH = 32
+# Dossier (à la racine du projet) où les répertoires sont renommés avant suppression
+TRASH_DIR_NAME = '_trash'
+# Racine du projet, résolue une seule fois à l'import
+_ROOT = Path(__file__).resolve().parents[2]
+# Éléments de la racine conservés par le nettoyage strict
+_WHITELIST_NAMES = frozenset({
+    'README.md', 'config.yaml', 'pyproject.toml', 'poetry.lock',
+    'aggregator', 'tests', '.github', 'run_menu.py', 'LICENSE', '.git'
+})
+_WHITELIST_PATHS = frozenset(_ROOT / name for name in _WHITELIST_NAMES)
+# Chemin réel du dépôt Git principal, pour reconnaître les liens qui pointent vers lui
+_ROOT_GIT = os.fspath(_ROOT / '.git')
+_ROOT_GIT_REAL = os.path.realpath(_ROOT_GIT)
+# Au-delà de ce nombre d'entrées, rsync --delete depuis un dossier vide est plus rapide que rm -rf
+RSYNC_MIN_ENTRIES = 10_000
+# Pas de fenêtre console pour les sous-processus Windows (0 ailleurs)
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+# Mise à jour de la progression Rich par lots : tous les N éléments ou toutes les N secondes
+PROGRESS_BATCH = 128
+PROGRESS_INTERVAL = 0.1
+# Colonnes de progression partagées (sans état propre à une instance de Progress)
+_PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    BarColumn(),
+    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+    TimeElapsedColumn(),
+)
+# Modes de permissions utilisés avant suppression
+_CHMOD_RW = stat.S_IWRITE | stat.S_IREAD
+_CHMOD_RWX = _CHMOD_RW | stat.S_IEXEC
+# Nombre maximal de dossiers .git supprimés simultanément
+GIT_CLEAN_CONCURRENCY = 8
+# Délai initial (secondes) entre deux tentatives de suppression, doublé à chaque échec
+RETRY_BASE_DELAY = 0.05
+
+
+@functools.lru_cache(maxsize=1)
+def _read_mounts() -> Tuple[Tuple[str, str], ...]:
+    """
+    Lit /proc/mounts une seule fois et retourne les couples (point de montage, type),
+    triés du plus long au plus court pour trouver en premier le montage le plus spécifique.
+    """
+    mounts: List[Tuple[str, str]] = []
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3:
+                    # Les espaces des points de montage sont encodés en octal (\040)
+                    mounts.append((fields[1].replace('\\040', ' '), fields[2]))
+    except OSError:
+        pass
+    mounts.sort(key=lambda m: len(m[0]), reverse=True)
+    return tuple(mounts)
+
+
+def _cleanup_width(path: Path) -> int:
+    """
+    Détermine le nombre de suppressions parallèles adapté au système de fichiers de path.
+    
+    Args:
+        path: Répertoire à nettoyer
+        
+    Returns:
+        int: 1 pour un système de fichiers réseau (NFS, SMB/CIFS, SSHFS), 32 sinon
+    """
+    target = os.path.abspath(path)
+    if os.name == 'nt':
+        # Chemin réseau UNC (\\serveur\partage)
+        return 1 if Path(target).drive.startswith('\\\\') else DEFAULT_CLEANUP_WIDTH
+    for mountpoint, fstype in _read_mounts():
+        if target == mountpoint or target.startswith(mountpoint.rstrip('/') + '/'):
+            return 1 if fstype.startswith(NETWORK_FSTYPES) else DEFAULT_CLEANUP_WIDTH
+    return DEFAULT_CLEANUP_WIDTH
+
+
+def _find_git_dirs(root: Path, skip: Collection[str] = ()) -> Iterator[Tuple[Path, bool]]:
+    """
+    Parcourt root en largeur avec os.scandir et produit chaque dossier .git rencontré,
+    avec un booléen indiquant s'il s'agit d'un lien (symbolique ou jonction) vers un dépôt.
+    Un lien ne doit être que délié : sa cible peut être un autre dépôt, voire le .git principal.
+    On ne descend jamais dans un .git trouvé (il va être supprimé en bloc) ni dans un lien.
+    
+    Args:
+        root: Répertoire racine du parcours
+        skip: Noms d'entrées à ignorer au premier niveau de root
+    """
+    queue = deque([(os.fspath(root), True)])
+    while queue:
+        current, top_level = queue.popleft()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if top_level and entry.name in skip:
+                        continue
+                    if entry.name == '.git':
+                        if entry.is_dir(follow_symlinks=False) and not _is_link(entry.path):
+                            yield Path(entry.path), False
+                        elif entry.is_dir():
+                            # Lien vers un dossier : signalé à part, pour être seulement délié
+                            yield Path(entry.path), True
+                    elif entry.is_dir(follow_symlinks=False):
+                        queue.append((entry.path, False))
+        except OSError:
+            continue
+
+
+def _is_link(path: Union[str, Path]) -> bool:
+    """Indique si path est un lien symbolique ou une jonction Windows (sans suivre le lien)."""
+    return os.path.islink(path) or getattr(os.path, 'isjunction', lambda _path: False)(path)
+
+
+def _remove_link(path: Union[str, Path]) -> None:
+    """Supprime un lien (symbolique ou jonction) sans jamais toucher à sa cible."""
+    try:
+        os.unlink(path)
+    except OSError:
+        # Jonction Windows : rmdir supprime la jonction, pas le dossier cible
+        os.rmdir(path)
+
+
+def _chmod_retry(func: Callable[[str], Any], path: str, exc_info: Any) -> None:
+    """
+    Callback d'erreur de shutil.rmtree : rend l'élément et son parent accessibles
+    en écriture puis retente l'opération une fois (erreurs ignorées ensuite).
+    """
+    with suppress(OSError):
+        os.chmod(os.path.dirname(path), _CHMOD_RWX)
+        os.chmod(path, _CHMOD_RWX)
+        func(path)
+
+
+def _rmtree_writable(path: Path) -> None:
+    """
+    shutil.rmtree en un seul parcours : les permissions ne sont corrigées que sur
+    les éléments dont la suppression échoue (onexc à partir de Python 3.12, onerror avant).
+    """
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_chmod_retry)
+    else:
+        shutil.rmtree(path, onerror=_chmod_retry)
+
+
+def _tree_has_more_than(root: Path, limit: int) -> bool:
+    """Indique si l'arbre root contient plus de limit entrées (arrêt dès que limit est dépassé)."""
+    count = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    count += 1
+                    if count > limit:
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
+
+
+def _native_remove(path: Path) -> bool:
+    """
+    Supprime un arbre avec l'outil natif de la plateforme, plus rapide que shutil.rmtree :
+    robocopy /MIR depuis un dossier vide puis rmdir sous Windows ; rsync --delete depuis
+    un dossier vide pour les très gros arbres puis rm -rf ailleurs.
+    Un lien n'est jamais confié à robocopy ni à rsync (ils videraient sa cible) : il est seulement délié.
+    
+    Args:
+        path: Répertoire à supprimer
+        
+    Returns:
+        bool: True si le répertoire n'existe plus
+    """
+    target = os.fspath(path)
+    if _is_link(target):
+        with suppress(OSError):
+            _remove_link(target)
+        return not os.path.lexists(target)
+    try:
+        if os.name == 'nt':  # Windows
+            if shutil.which('robocopy'):
+                with tempfile.TemporaryDirectory() as empty_dir:
+                    subprocess.run(
+                        ['robocopy', empty_dir, target, '/MIR', '/NFL', '/NDL', '/NJH', '/NJS', '/NC', '/NS', '/NP'],
+                        stdout=subprocess.DEVNULL, creationflags=_CREATE_NO_WINDOW
+                    )
+            # argv direct sans shell=True : pas d'injection via le chemin, /d ignore l'AutoRun de cmd.exe
+            subprocess.run(
+                ['cmd.exe', '/d', '/c', 'rmdir', '/s', '/q', target],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=_CREATE_NO_WINDOW
+            )
+        else:  # Unix/Linux
+            if shutil.which('rsync') and _tree_has_more_than(path, RSYNC_MIN_ENTRIES):
+                with tempfile.TemporaryDirectory() as empty_dir:
+                    subprocess.run(['rsync', '-a', '--delete', empty_dir + '/', target + '/'], stdout=subprocess.DEVNULL)
+            subprocess.run(['rm', '-rf', target])
+    except OSError:
+        return False
+    return not os.path.lexists(target)
+
+
+def _purge_tree(path: Path) -> None:
+    """Suppression en arrière-plan d'un répertoire de la corbeille : outil natif, puis shutil.rmtree."""
+    if _is_link(path):
+        # Un lien renommé dans la corbeille : le délier, sans jamais parcourir sa cible
+        with suppress(OSError):
+            _remove_link(path)
+        return
+    if not _native_remove(path):
+        _rmtree_writable(path)
+
+
+def _unlink_retry(name: str, dir_fd: Optional[int] = None) -> None:
+    """Supprime un fichier ; en cas d'échec, rend le fichier accessible en écriture et réessaie une fois."""
+    try:
+        os.unlink(name, dir_fd=dir_fd)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        with suppress(OSError):
+            os.chmod(name, _CHMOD_RW, dir_fd=dir_fd, follow_symlinks=False)
+        with suppress(OSError):
+            os.unlink(name, dir_fd=dir_fd)
+
+
+def _bottom_up_delete(root: Path) -> None:
+    """
+    Supprime un répertoire fichier par fichier, des feuilles vers la racine.
+    Sous Unix, os.fwalk travaille relativement aux descripteurs des répertoires
+    (openat/unlinkat) au lieu de résoudre le chemin complet de chaque entrée.
+    """
+    if hasattr(os, 'fwalk'):
+        for _, dirnames, filenames, dirfd in os.fwalk(root, topdown=False):
+            for name in filenames:
+                _unlink_retry(name, dirfd)
+            for name in dirnames:
+                # Les liens symboliques vers des répertoires figurent dans dirnames
+                try:
+                    os.rmdir(name, dir_fd=dirfd)
+                except NotADirectoryError:
+                    _unlink_retry(name, dirfd)
+                except OSError:
+                    pass
+    else:
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+            for name in filenames:
+                _unlink_retry(os.path.join(dirpath, name))
+            for name in dirnames:
+                full = os.path.join(dirpath, name)
+                with suppress(OSError):
+                    if os.path.islink(full):
+                        os.unlink(full)
+                    else:
+                        os.rmdir(full)
+    with suppress(OSError):
+        os.rmdir(root)
+
+
+def _links_to_root_git(git_dir: Path) -> bool:
+    """
+    Indique si git_dir est un lien symbolique vers le .git principal.
+    Un seul readlink suffit quand la cible est absolue ; realpath n'est utilisé
+    que pour les cibles relatives ou indirectes.
+    """
+    try:
+        target = os.readlink(git_dir)
+    except OSError:
+        # Pas un lien symbolique
+        return False
+    if target in (_ROOT_GIT, _ROOT_GIT_REAL):
+        return True
+    return os.path.realpath(git_dir) == _ROOT_GIT_REAL
+
+
+def _list_entries(directory: Path) -> List['os.DirEntry[str]']:
+    """Liste le contenu de directory avec os.scandir (types d'entrées déjà connus, pas de Path)."""
+    with os.scandir(directory) as it:
+        return list(it)
+
+
+def _delete_item(entry: 'os.DirEntry[str]') -> None:
+    """
+    Supprime un fichier (après l'avoir rendu accessible en écriture) ou un répertoire.
+    Un lien est seulement délié : chmod suivrait le lien et modifierait sa cible.
+    """
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path, ignore_errors=True)
+    else:
+        if entry.is_file(follow_symlinks=False):
+            with suppress(OSError):
+                os.chmod(entry.path, _CHMOD_RW)
+        with suppress(FileNotFoundError):
+            os.unlink(entry.path)
+
+
 class CleaningMixin:
     """Mixin pour les fonctionnalités de nettoyage de l'orchestrateur."""
     
     # Attributs hérités de OrchestratorBase
+    config: Optional[Config]
     console: 'Console'
     raw_dir: Path
     normalized_dir: Path
@@ -38,33 +348,49 @@ class CleaningMixin:
         Vide également complètement le dossier data s'il existe.
         Utilise plusieurs stratégies robustes pour assurer la suppression complète des fichiers et dossiers, même verrouillés.
         """
-        ROOT = Path(__file__).resolve().parent.parent.parent
-        whitelist = {
-            'README.md', 'config.yaml', 'pyproject.toml', 'poetry.lock',
-            'aggregator', 'tests', '.github', 'run_menu.py', 'LICENSE', '.git'
-        }
-    
         # Fonction pour rendre un répertoire accessible en écriture (résoudre les problèmes de permissions)
-        async def make_writable(path: Path) -> None:
-            """Rend un répertoire et son contenu accessible en écriture pour faciliter la suppression."""
+        def make_writable(path: Path) -> None:
+            """
+            Rend un répertoire et son contenu accessible en écriture pour faciliter la suppression.
+            Parcours itératif avec os.scandir : les types des entrées sont lus depuis le répertoire
+            lui-même, sans stat() supplémentaire par fichier.
+            """
             if not path.exists():
                 return
                 
             try:
-                if path.is_file() or path.is_symlink():
+                if path.is_symlink() or not path.is_dir():
                     # Rendre le fichier accessible en écriture
-                    os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
-                elif path.is_dir():
-                    # Rendre le répertoire accessible en écriture
-                    os.chmod(path, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
-                    # Traiter récursivement tous les éléments du répertoire
-                    for item in path.iterdir():
-                        await make_writable(item)
+                    os.chmod(path, _CHMOD_RW)
+                    return
+                # Rendre le répertoire accessible en écriture
+                os.chmod(path, _CHMOD_RWX)
             except Exception as e:
                 self.console.print(f"[red]Erreur lors de la modification des permissions de {path}: {e}[/red]")
+                return
+
+            # Pile explicite des répertoires restant à parcourir (pas de récursion)
+            stack = [os.fspath(path)]
+            while stack:
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    os.chmod(entry.path, _CHMOD_RWX)
+                                    stack.append(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    # Les liens symboliques sont ignorés : leur suppression ne dépend
+                                    # que des droits du répertoire parent
+                                    os.chmod(entry.path, _CHMOD_RW)
+                            except Exception as e:
+                                self.console.print(f"[red]Erreur lors de la modification des permissions de {entry.path}: {e}[/red]")
+                except Exception as e:
+                    self.console.print(f"[red]Erreur lors de la modification des permissions de {current}: {e}[/red]")
                 
         # Fonction pour renommer puis supprimer (contourne certains verrouillages)
-        async def rename_and_remove(path: Path) -> bool:
+        def rename_and_remove(path: Path) -> bool:
             """Renomme un répertoire puis le supprime pour contourner certains verrouillages."""
             if not path.exists():
                 return True
@@ -84,73 +410,52 @@ class CleaningMixin:
                 return False
                 
         # Fonction pour supprimer les fichiers individuellement
-        async def remove_files_individually(path: Path) -> bool:
+        def remove_files_individually(path: Path) -> bool:
             """Supprime les fichiers un par un pour contourner les verrouillages partiels."""
             if not path.exists() or not path.is_dir():
                 return True
                 
             try:
                 # Rendre tous les fichiers accessibles en écriture d'abord
-                await make_writable(path)
-                
-                # Supprimer les fichiers un par un
-                for item in list(path.iterdir()):
-                    try:
-                        if item.is_file() or item.is_symlink():
-                            item.unlink(missing_ok=True)
-                        elif item.is_dir():
-                            await remove_files_individually(item)
-                    except Exception as e:
-                        self.console.print(f"[red]Erreur lors de la suppression de {item}: {e}[/red]")
-                
-                # Essayer de supprimer le répertoire maintenant vide
-                with suppress(Exception):
-                    path.rmdir()
+                make_writable(path)
+                _bottom_up_delete(path)
                 return True
             except Exception as e:
                 self.console.print(f"[red]Erreur lors de la suppression individuelle des fichiers dans {path}: {e}[/red]")
                 return False
                 
-        # Fonction robuste pour supprimer un répertoire avec plusieurs tentatives et stratégies
         async def robust_rmtree(path: Path, max_attempts: int = 5) -> bool:
-            """Supprime un répertoire de manière robuste avec plusieurs tentatives et stratégies."""
+            """
+            Supprime un répertoire de manière robuste.
+            Chemin rapide : renommage atomique dans la corbeille puis suppression en arrière-plan,
+            le chemin d'origine est libéré immédiatement. Les stratégies successives ne servent
+            que si le renommage échoue (verrou, permissions, autre système de fichiers).
+            """
             if not path.exists():
                 return True
             
-            self.console.print(f"[bold yellow]Tentative de suppression robuste de {path}[/bold yellow]")
-            
-            # Stratégies de suppression à essayer dans l'ordre
-            # Fonction auxiliaire pour appeler make_writable puis supprimer
-            async def make_writable_and_remove(p: Path) -> None:
-                await make_writable(p)
-                shutil.rmtree(p, ignore_errors=True)
-            
-            # Fonction pour utiliser subprocess
-            def subprocess_remove(p: Path) -> subprocess.CompletedProcess[bytes]:
-                if os.name == 'nt':  # Windows
-                    return subprocess.run(f'rmdir /s /q "{p}"', shell=True)
-                else:  # Unix/Linux
-                    return subprocess.run(['rm', '-rf', str(p)])
-                
-            # Type des stratégies : Callable[[Path], Awaitable[Any]]
+            try:
+                trash_dir.mkdir(exist_ok=True)
+                trash_entry = trash_dir / uuid.uuid4().hex
+                os.replace(path, trash_entry)
+                trash_jobs.append(loop.run_in_executor(trash_pool, _purge_tree, trash_entry))
+                return True
+            except OSError as e:
+                self.console.print(f"[bold yellow]Tentative de suppression robuste de {path} (renommage impossible : {e})[/bold yellow]")
+                if e.errno in (errno.EACCES, errno.EPERM):
+                    # Permissions insuffisantes : les corriger avant les stratégies de suppression
+                    await loop.run_in_executor(None, make_writable, path)
             
-            # Convertir les fonctions synchrones en asynchrones pour uniformiser les types
-            async def sync_rmtree(p: Path) -> None:
-                shutil.rmtree(p, ignore_errors=True)
-                
-            async def sync_subprocess_remove(p: Path) -> subprocess.CompletedProcess[bytes]:
-                return subprocess_remove(p)
+            # Stratégies synchrones, exécutées hors de la boucle d'événements
+            strategies: List[Callable[[Path], Any]] = [
+                # Stratégie 1: outil natif (rm -rf / rsync --delete, Windows: robocopy /MIR + rmdir)
+                _native_remove,
                 
-            strategies = [
-                # Liste explicitement typée de fonctions asynchrones traitant des Path
-                # Stratégie 1: shutil.rmtree standard
-                sync_rmtree,
+                # Stratégie 2: shutil.rmtree standard
+                functools.partial(shutil.rmtree, ignore_errors=True),
                 
-                # Stratégie 2: utiliser subprocess pour appeler rm -rf (Windows: rmdir /s /q)
-                sync_subprocess_remove,
-                
-                # Stratégie 3: Rendre accessible en écriture puis supprimer
-                make_writable_and_remove,
+                # Stratégie 3: supprimer en corrigeant les permissions des seuls éléments en échec
+                _rmtree_writable,
                 
                 # Stratégie 4: Renommer puis supprimer (fonction locale)
                 rename_and_remove,
@@ -163,8 +468,8 @@ class CleaningMixin:
             for attempt in range(max_attempts):
                 strategy_index = min(attempt, len(strategies) - 1)
                 try:
-                    # Appel direct de la fonction asynchrone avec son paramètre
-                    await strategies[strategy_index](path)
+                    # Exécution de la stratégie dans un thread pour ne pas bloquer la boucle
+                    await loop.run_in_executor(None, strategies[strategy_index], path)
                     
                     # Vérifier si le répertoire existe encore
                     if not path.exists():
@@ -181,9 +486,12 @@ class CleaningMixin:
                             pass
                             
                     self.console.print(f"[yellow]Tentative {attempt+1} échouée, essai d'une autre stratégie...[/yellow]")
-                    time.sleep(1)  # Pause avant la prochaine tentative
                 except Exception as e:
                     self.console.print(f"[red]Erreur lors de la tentative {attempt+1}: {e}[/red]")
+                
+                # Attente exponentielle (50, 100, 200, 400 ms...) sans bloquer les autres tâches
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(RETRY_BASE_DELAY * (2 ** attempt))
                     
             self.console.print(f"[bold red]Échec de toutes les tentatives de suppression pour {path}[/bold red]")
             return False
@@ -196,9 +504,18 @@ class CleaningMixin:
             
             # Rechercher tous les dossiers .git, mais exclure le dossier .git principal s'il est dans la whitelist
             git_dirs = []
-            for git_dir in path.glob("**/.git"):
+            skip = _WHITELIST_NAMES if path == _ROOT else ()
+            for git_dir, is_link in _find_git_dirs(path, skip):
+                if is_link:
+                    # Lien vers un dépôt (éventuellement le .git principal) : délier le lien seulement
+                    try:
+                        _remove_link(git_dir)
+                        self.console.print(f"[green]Suppression du lien Git : {git_dir}[/green]")
+                    except OSError as e:
+                        self.console.print(f"[red]Impossible de supprimer le lien Git {git_dir}: {e}[/red]")
+                    continue
                 # Vérifier si c'est le dossier .git principal (à la racine)
-                if git_dir.parent == ROOT and '.git' in whitelist:
+                if git_dir in _WHITELIST_PATHS:
                     self.console.print(f"[bold blue]Protection du dossier Git principal (.git est dans la whitelist)[/bold blue]")
                     continue
                 git_dirs.append(git_dir)
@@ -206,41 +523,53 @@ class CleaningMixin:
             if git_dirs:
                 self.console.print(f"[bold yellow]Nettoyage de {len(git_dirs)} dossiers Git trouvés...[/bold yellow]")
                 
-                for git_dir in git_dirs:
-                    # Supprimer d'abord les fichiers index.lock qui peuvent bloquer la suppression
-                    lock_file = git_dir / "index.lock"
-                    if lock_file.exists():
+                async def clean_one(git_dir: Path) -> None:
+                    async with git_semaphore:
+                        # Supprimer d'abord les fichiers index.lock qui peuvent bloquer la suppression
+                        lock_file = git_dir / "index.lock"
+                        if lock_file.exists():
+                            try:
+                                os.chmod(lock_file, _CHMOD_RW)
+                                lock_file.unlink()
+                                self.console.print(f"[yellow]Suppression du verrou Git : {lock_file}[/yellow]")
+                            except Exception as e:
+                                self.console.print(f"[red]Impossible de supprimer le verrou Git {lock_file}: {e}[/red]")
+                        
+                        # Supprimer le dossier .git (sauf celui à la racine qui est protégé)
                         try:
-                            os.chmod(lock_file, stat.S_IWRITE | stat.S_IREAD)
-                            lock_file.unlink()
-                            self.console.print(f"[yellow]Suppression du verrou Git : {lock_file}[/yellow]")
+                            await robust_rmtree(git_dir)
+                            self.console.print(f"[green]Suppression du dossier Git : {git_dir}[/green]")
                         except Exception as e:
-                            self.console.print(f"[red]Impossible de supprimer le verrou Git {lock_file}: {e}[/red]")
-                    
-                    # Supprimer le dossier .git (sauf celui à la racine qui est protégé)
-                    try:
-                        await robust_rmtree(git_dir)
-                        self.console.print(f"[green]Suppression du dossier Git : {git_dir}[/green]")
-                    except Exception as e:
-                        self.console.print(f"[red]Erreur lors de la suppression du dossier Git {git_dir}: {e}[/red]")
+                            self.console.print(f"[red]Erreur lors de la suppression du dossier Git {git_dir}: {e}[/red]")
+                
+                # Les dossiers .git sont indépendants : les supprimer en parallèle
+                await asyncio.gather(*(clean_one(git_dir) for git_dir in git_dirs), return_exceptions=True)
         
+        # Corbeille (même système de fichiers que le projet) et pool de suppression en arrière-plan
+        trash_dir = _ROOT / TRASH_DIR_NAME
+        trash_pool = ThreadPoolExecutor(max_workers=self._cleanup_concurrency(_ROOT))
+        trash_jobs: List['asyncio.Future[None]'] = []
+        loop = asyncio.get_running_loop()
+        # Limite les suppressions de dossiers .git simultanées (descripteurs de fichiers)
+        git_semaphore = asyncio.Semaphore(GIT_CLEAN_CONCURRENCY)
+
         # 1. Nettoyage des fichiers et dossiers à la racine (sauf liste blanche)
         self.console.print("\n[bold magenta]Nettoyage strict du projet (liste blanche)...[/bold magenta]")
         
         # Nettoyer d'abord les dossiers Git pour éviter les problèmes de verrouillage
-        for item in ROOT.iterdir():
-            if item.name in whitelist or not item.is_dir():
+        for item in _ROOT.iterdir():
+            if item.name in _WHITELIST_NAMES or item.name == TRASH_DIR_NAME or not item.is_dir():
                 continue
             await clean_git_directories(item)
         
         # Supprimer les éléments non whitelistés
-        for item in ROOT.iterdir():
-            if item.name in whitelist:
+        for item in _ROOT.iterdir():
+            if item.name in _WHITELIST_NAMES or item.name == TRASH_DIR_NAME:
                 continue
             
             try:
                 if item.is_file() or item.is_symlink():
-                    os.chmod(item, stat.S_IWRITE | stat.S_IREAD)
+                    os.chmod(item, _CHMOD_RW)
                     item.unlink()
                     self.console.print(f"[yellow]Suppression fichier : {item}[/yellow]")
                 elif item.is_dir():
@@ -250,16 +579,16 @@ class CleaningMixin:
                 self.console.print(f"[red]Erreur suppression {item} : {e}[/red]")
         
         # 2. Nettoyage et recréation du dossier data
-        data_dir = ROOT / 'data'
+        data_dir = _ROOT / 'data'
         if data_dir.exists():
             self.console.print("\n[bold magenta]Nettoyage complet du dossier data...[/bold magenta]")
             
             # Nous n'avons pas besoin de nettoyer les dossiers Git dans data car nous allons supprimer tout le dossier
             # Vérifions juste qu'il n'y a pas un lien symbolique vers le .git principal pour éviter de le supprimer
-            root_git_dir = ROOT / '.git'
-            if root_git_dir.exists() and '.git' in whitelist:
-                for git_dir in data_dir.glob("**/.git"):
-                    if git_dir.resolve() == root_git_dir.resolve():
+            if '.git' in _WHITELIST_NAMES and os.path.isdir(_ROOT_GIT_REAL):
+                for git_dir, is_link in _find_git_dirs(data_dir):
+                    # Seul un lien symbolique peut désigner le .git principal depuis data
+                    if is_link and _links_to_root_git(git_dir):
                         self.console.print(f"[bold red]Attention! Détection d'un lien vers le .git principal dans {git_dir}, protection activée[/bold red]")
                         # Ne pas supprimer data_dir directement, mais plutôt son contenu item par item
                         for item in data_dir.iterdir():
@@ -276,6 +605,14 @@ class CleaningMixin:
                 # Supprimer le dossier data avec notre méthode robuste
                 await robust_rmtree(data_dir)
         
+        # Attendre la fin des suppressions en arrière-plan puis supprimer la corbeille
+        if trash_jobs:
+            self.console.print(f"[cyan]Finalisation de {len(trash_jobs)} suppressions en arrière-plan...[/cyan]")
+            await asyncio.gather(*trash_jobs, return_exceptions=True)
+        trash_pool.shutdown(wait=False)
+        if trash_dir.exists():
+            await asyncio.to_thread(_rmtree_writable, trash_dir)
+        
         # Recréer le dossier data vide
         if not data_dir.exists():
             data_dir.mkdir(parents=True, exist_ok=True)
@@ -290,6 +627,84 @@ class CleaningMixin:
         
         self.console.print("[bold green]✓ Nettoyage strict terminé. Seuls les fichiers essentiels sont conservés.[/bold green]")
 
+    def _cleanup_concurrency(self, path: Path) -> int:
+        """
+        Retourne le nombre de suppressions parallèles pour path : la valeur
+        defaults.cleanup_concurrency si elle est configurée, sinon la détection automatique.
+        """
+        config = getattr(self, 'config', None)
+        configured = config.defaults.cleanup_concurrency if config else None
+        if configured and configured > 0:
+            return configured
+        return _cleanup_width(path)
+
+    async def _delete_concurrently(
+        self,
+        items: Iterable['os.DirEntry[str]'],
+        width: int,
+        progress: Progress,
+        task: TaskID,
+        report_errors: bool = True
+    ) -> None:
+        """
+        Supprime les éléments dans un pool de threads dédié (au plus width à la fois)
+        et fait avancer la progression par lots (PROGRESS_BATCH éléments ou
+        PROGRESS_INTERVAL secondes) pour ne pas saturer le rendu Rich.
+        
+        Args:
+            items: Fichiers et répertoires à supprimer
+            width: Nombre maximal de suppressions simultanées
+            progress: Barre de progression Rich
+            task: Tâche de progression à faire avancer
+            report_errors: Si False, les erreurs de suppression sont ignorées silencieusement
+        """
+        def delete(item: 'os.DirEntry[str]') -> Tuple[str, Optional[Exception]]:
+            try:
+                _delete_item(item)
+                return item.path, None
+            except Exception as e:
+                return item.path, e
+
+        loop = asyncio.get_running_loop()
+        max_workers = max(1, min(width, (os.cpu_count() or 1) * 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [loop.run_in_executor(pool, delete, item) for item in items]
+            pending = 0
+            last_flush = time.monotonic()
+            for next_done in asyncio.as_completed(futures):
+                item, error = await next_done
+                if error is not None and report_errors:
+                    self.console.print(f"[red]Erreur lors de la suppression de {item}: {error}[/red]")
+                pending += 1
+                if pending >= PROGRESS_BATCH or time.monotonic() - last_flush > PROGRESS_INTERVAL:
+                    progress.update(task, advance=pending)
+                    pending = 0
+                    last_flush = time.monotonic()
+            if pending:
+                progress.update(task, advance=pending)
+
+    async def _clear_dir(self, label: str, *directories: Path, report_errors: bool = True) -> None:
+        """
+        Vide le contenu des répertoires indiqués avec une barre de progression commune.
+        Les répertoires inexistants sont ignorés.
+        
+        Args:
+            label: Libellé de la tâche de progression
+            directories: Répertoires dont le contenu doit être supprimé
+            report_errors: Si False, les erreurs de suppression sont ignorées silencieusement
+        """
+        items: List['os.DirEntry[str]'] = []
+        for directory in directories:
+            # Pas de exists() préalable : un répertoire absent est simplement ignoré
+            with suppress(FileNotFoundError):
+                items.extend(_list_entries(directory))
+        # Barre de progression Rich
+        with Progress(*_PROGRESS_COLUMNS, console=self.console) as progress:
+            task = progress.add_task(label, total=len(items))
+            await self._delete_concurrently(
+                items, self._cleanup_concurrency(directories[-1]), progress, task, report_errors=report_errors
+            )
+
     # Ancienne méthode conservée pour référence ou fallback
     async def run_clear_all(self) -> None:
         """
@@ -322,28 +737,7 @@ class CleaningMixin:
         if not hasattr(self, 'raw_dir') or not self.raw_dir.exists():
             self.console.print("[yellow]Le dossier raw n'existe pas ou n'est pas configuré.[/yellow]")
             return
-        # Récupérer tous les fichiers et répertoires à supprimer
-        items = list(self.raw_dir.glob('*'))
-        total = len(items)
-        # Barre de progression Rich
-        with Progress(
-            SpinnerColumn(),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Suppression raw", total=total)
-            for item in items:
-                try:
-                    if item.is_file():
-                        os.chmod(item, stat.S_IWRITE | stat.S_IREAD)
-                        item.unlink()
-                    else:
-                        shutil.rmtree(item, ignore_errors=True)
-                except Exception as e:
-                    self.console.print(f"[red]Erreur lors de la suppression de {item}: {e}[/red]")
-                progress.update(task, advance=1)
+        await self._clear_dir("Suppression raw", self.raw_dir)
         self.console.print("[green]✓ Dossier raw vidé avec succès ![/green]")
         # Réinitialiser les statistiques
         self.stats['sources_downloaded'] = 0
@@ -355,31 +749,10 @@ class CleaningMixin:
         Vide le cache des données normalisées.
         """
         self.console.print("\n[bold blue]Nettoyage du cache normalisé avec progression...[/bold blue]")
-        dir_norm = self.normalized_dir
-        if not dir_norm.exists():
+        if not self.normalized_dir.exists():
             self.console.print("[yellow]Le dossier normalized n'existe pas ou n'est pas configuré.[/yellow]")
             return
-        # Récupérer les fichiers et répertoires à supprimer
-        items = list(dir_norm.glob('*'))
-        total = len(items)
-        # Barre de progression Rich
-        with Progress(
-            SpinnerColumn(),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Suppression normalized", total=total)
-            for item in items:
-                try:
-                    if item.is_file():
-                        item.unlink()
-                    else:
-                        shutil.rmtree(item, ignore_errors=True)
-                except Exception as e:
-                    self.console.print(f"[red]Erreur lors de la suppression de {item}: {e}[/red]")
-                progress.update(task, advance=1)
+        await self._clear_dir("Suppression normalized", self.normalized_dir)
         self.console.print("[green]✓ Cache normalisé vidé avec succès ![/green]")
     
     async def run_clear_temp(self) -> None:
@@ -387,36 +760,12 @@ class CleaningMixin:
         Supprime les chunks, le cache dédupliqué et l'output final.
         """
         self.console.print("\n[bold blue]Suppression temporaire (splits, deduped, output) avec progression...[/bold blue]")
-        targets = [self.output_dir / "splits", self.deduped_dir, self.output_dir]
-        # Collecter tous les fichiers et dossiers à supprimer
-        all_items: List[Path] = []
-        for d in targets:
-            if d.exists():
-                for item in d.glob('*'):
-                    all_items.append(item)
-        total = len(all_items)
-        # Barre de progression Rich
-        with Progress(
-            SpinnerColumn(),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Suppression temporaire", total=total)
-            for item in all_items:
-                try:
-                    if item.is_file():
-                        item.unlink(missing_ok=True)
-                    else:
-                        shutil.rmtree(str(item), ignore_errors=True)
-                except Exception:
-                    pass
-                progress.update(task, advance=1)
+        # output/splits est vidé avec output : lister aussi ce sous-dossier ferait supprimer ses fichiers
+        # par un thread pendant qu'un autre supprime le dossier entier (et les compterait deux fois)
+        await self._clear_dir("Suppression temporaire", self.deduped_dir, self.output_dir, report_errors=False)
         # Recréer les dossiers nécessaires
-        for d in targets:
-            if d != self.output_dir:
-                d.mkdir(parents=True, exist_ok=True)
+        for d in (self.output_dir / "splits", self.deduped_dir):
+            d.mkdir(parents=True, exist_ok=True)
         self.console.print("[green]✓ Suppression temporaire terminée avec succès ![/green]")
 
     async def run_clear_split_deduped(self) -> None:
@@ -428,26 +777,5 @@ class CleaningMixin:
         if not dir_to_clear.exists():
             self.console.print(f"[yellow]{dir_to_clear} n'existe pas.[/yellow]")
             return
-        # Collecter les éléments à supprimer
-        items = list(dir_to_clear.glob('*'))
-        total = len(items)
-        # Barre de progression Rich
-        with Progress(
-            SpinnerColumn(),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Suppression splits dédupliqués", total=total)
-            for item in items:
-                try:
-                    if item.is_file():
-                        item.unlink()
-                    else:
-                        shutil.rmtree(item, ignore_errors=True)
-                except Exception as e:
-                    self.console.print(f"[red]Erreur lors de la suppression de {item}: {e}[/red]")
-                progress.update(task, advance=1)
+        await self._clear_dir("Suppression splits dédupliqués", dir_to_clear)
         self.console.print("[green]✓ Splits dédupliqués supprimés avec succès ![/green]")
-
@@ -9,6 +9,8 @@ from .splitting import SplittingMixin
 from .interactive import InteractiveMixin
 from .utils import UtilsMixin
 
+__all__ = ['CombinedOrchestrator']
+
 
 class CombinedOrchestrator(
     CleaningMixin,
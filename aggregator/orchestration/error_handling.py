@@ -4,21 +4,68 @@ dans l'orchestrateur d'aggregator Nickname.
 """
 
 import functools
+import time
 import traceback
-from datetime import datetime
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, TypeVar, cast, Optional
 
 # Type variables pour les annotations
 F = TypeVar('F', bound=Callable[..., Any])
 
+
+@dataclass(slots=True, frozen=True)
+class ErrorEntry:
+    """Erreur collectée par log_errors/capture_errors dans errors_log."""
+    time: str
+    phase: str
+    type: str
+    message: str
+    stack_trace: str
+
+
+def _record_error(self: Any, phase_name: str, e: Exception, label: str) -> None:
+    """
+    Enregistre une exception dans le collecteur d'erreurs et le logger de l'orchestrateur.
+    La stack trace et l'horodatage ne sont calculés que si au moins une destination existe.
+
+    Args:
+        self: Instance de l'orchestrateur
+        phase_name: Nom de la phase pour l'identification dans les logs
+        e: Exception capturée
+        label: Préfixe du message de log
+    """
+    errors_log = getattr(self, 'errors_log', None)
+    logger = getattr(self, 'logger', None)
+    if errors_log is None and logger is None:
+        return
+
+    # Récupérer la stack trace
+    stack_trace = traceback.format_exc()
+
+    # Ajouter à la liste des erreurs de l'orchestrateur
+    if errors_log is not None:
+        errors_log.append(ErrorEntry(
+            time=time.strftime('%H:%M:%S'),
+            phase=phase_name,
+            type=type(e).__name__,
+            message=str(e),
+            stack_trace=stack_trace
+        ))
+
+    # Logger avec loguru si disponible
+    if logger is not None:
+        logger.error(f"{label} {phase_name}: {e}")
+        logger.debug(f"Stack trace: {stack_trace}")
+
+
 def log_errors(phase_name: str) -> Callable[[F], F]:
     """
     Décorateur qui capture les exceptions, les logue avec loguru et les ajoute
     au collecteur d'erreurs de l'orchestrateur.
-    
+
     Args:
         phase_name: Nom de la phase pour l'identification dans les logs
-        
+
     Returns:
         Décorateur configuré avec le nom de phase
     """
@@ -28,30 +75,10 @@ def log_errors(phase_name: str) -> Callable[[F], F]:
             try:
                 return await func(self, *args, **kwargs)
             except Exception as e:
-                # Récupérer la stack trace
-                stack_trace = traceback.format_exc()
-                
-                # Créer une entrée d'erreur
-                error_entry = {
-                    'time': datetime.now().strftime('%H:%M:%S'),
-                    'phase': phase_name,
-                    'type': type(e).__name__,
-                    'message': str(e),
-                    'stack_trace': stack_trace
-                }
-                
-                # Ajouter à la liste des erreurs de l'orchestrateur
-                if hasattr(self, 'errors_log'):
-                    self.errors_log.append(error_entry)
-                
-                # Logger avec loguru si disponible
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Erreur dans {phase_name}: {str(e)}")
-                    self.logger.debug(f"Stack trace: {stack_trace}")
-                
+                _record_error(self, phase_name, e, "Erreur dans")
                 # Propager l'exception pour la gestion au niveau supérieur
                 raise
-                
+
         return cast(F, wrapper)
     return decorator
 
@@ -61,10 +88,10 @@ def capture_errors(phase_name: str) -> Callable[[F], F]:
     et les ajoute au collecteur d'erreurs de l'orchestrateur.
     Utile pour les opérations non-critiques où l'échec d'une étape ne doit pas
     arrêter le processus global.
-    
+
     Args:
         phase_name: Nom de la phase pour l'identification dans les logs
-        
+
     Returns:
         Décorateur configuré avec le nom de phase
     """
@@ -74,29 +101,9 @@ def capture_errors(phase_name: str) -> Callable[[F], F]:
             try:
                 return await func(self, *args, **kwargs)
             except Exception as e:
-                # Récupérer la stack trace
-                stack_trace = traceback.format_exc()
-                
-                # Créer une entrée d'erreur
-                error_entry = {
-                    'time': datetime.now().strftime('%H:%M:%S'),
-                    'phase': phase_name,
-                    'type': type(e).__name__,
-                    'message': str(e),
-                    'stack_trace': stack_trace
-                }
-                
-                # Ajouter à la liste des erreurs de l'orchestrateur
-                if hasattr(self, 'errors_log'):
-                    self.errors_log.append(error_entry)
-                
-                # Logger avec loguru si disponible
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Erreur non-critique dans {phase_name}: {str(e)}")
-                    self.logger.debug(f"Stack trace: {stack_trace}")
-                
+                _record_error(self, phase_name, e, "Erreur non-critique dans")
                 # Retourner None au lieu de propager l'exception
                 return None
-                
+
         return cast(F, wrapper)
     return decorator
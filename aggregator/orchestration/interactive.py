@@ -3,49 +3,55 @@ Module d'interface interactive pour l'orchestrateur d'aggregator Nickname.
 Contient toutes les fonctions liées à l'interface utilisateur interactive.
 """
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import asyncio
+import os
+import functools
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..config import Config
-    from rich.console import Console as RichConsoleForTyping # Alias pour le type checking
 from pathlib import Path
 
 # Imports utilisés directement dans ce module
+from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 # ATTENTION : Ce module ne doit JAMAIS importer CombinedOrchestrator pour éviter les circular imports.
 # Toute logique de lancement interactif doit être gérée dans interactive_runner.py.
-from .translations import get_translation
+from .translations import MsgId, get_rendered, get_rich, message_table
+from .splitting import DEFAULT_LINES_PER_FILE
 
-# Imports conditionnels pour les annotations de type
-if TYPE_CHECKING:
-    from rich.console import Console
 
+# Condition vérifiée avant ou après une étape : (test, cause affichée en cas d'échec)
+_StepCheck = Tuple[Callable[[], bool], str]
 
-# Cette fonction a été déplacée dans interactive_runner.py
-# pour éviter les circular imports
 
+@dataclass(frozen=True)
+class _AutoStep:
+    """Étape du processus automatique."""
+    label: str
+    run: Callable[[], Awaitable[Any]]
+    before: Optional[_StepCheck] = None
+    after: Optional[_StepCheck] = None
 
-class InteractiveMixin:
-    # Déclarations de type pour les attributs et méthodes attendus d'autres Mixins ou classes de base
-    # Déclarations de type pour les attributs attendus
-    config: 'Config'  # Sera résolu par le bloc TYPE_CHECKING
-    stats: Dict[str, Any]
-    console: 'RichConsoleForTyping' # Sera résolu par le bloc TYPE_CHECKING
 
-    # Déclarations de méthodes attendues (implémentées dans d'autres mixins)
-    async def run_clear_project_strict(self) -> None:
-        ...
+# Lignes du tableau des statistiques : (clé de traduction du libellé, clé de self.stats)
+_STATS_ROWS = (
+    (MsgId.stats_row_1, "sources_downloaded"),
+    (MsgId.stats_row_2, "entries_raw"),
+    (MsgId.stats_row_3, "entries_normalized"),
+    (MsgId.stats_row_4, "entries_deduped"),
+)
+
 
-    async def run_download_sources(self) -> None:
-        ...
+# Cette fonction a été déplacée dans interactive_runner.py
+# pour éviter les circular imports
 
-    async def run_normalize(self) -> None:
-        ...
-    # D'autres méthodes comme run_create_chunks, etc., pourraient nécessiter des déclarations similaires
-    # si des erreurs de lint apparaissent pour elles ou si elles ont des implémentations vides ici.
 
+class InteractiveMixin:
     """
     Mixin pour les fonctionnalités d'interface interactive de l'orchestrateur.
     
@@ -64,7 +70,7 @@ class InteractiveMixin:
     
     # Attributs attendus (fournis par OrchestratorBase)
     console: 'Console'
-    config: Any
+    config: 'Config'
     stats: Dict[str, int]
     lang: str
     
@@ -82,10 +88,12 @@ class InteractiveMixin:
     
     # Méthodes de SplittingMixin
     async def run_split_normalized(self) -> None: ...
-    async def run_split_deduped(self, auto_mode: bool = False) -> None: ...
+    async def run_split_deduped(self, auto_mode: bool = False, lines_per_file: Optional[int] = None) -> None: ...
     async def run_deduplicate(self) -> None: ...
     
     # Méthodes de UtilsMixin
+    async def run_download_sources(self) -> None: ...
+    async def run_normalize(self) -> None: ...
     async def run_export_all(self) -> None: ...
     async def run_export_nicknames(self) -> None: ...
     async def run_export_emails(self) -> None: ...
@@ -105,371 +113,250 @@ class InteractiveMixin:
             - self.console: Instance de rich.console.Console (fournie par OrchestratorBase)
             - self.config: Configuration chargée (fournie par OrchestratorBase)
         """
-        # Vérification que les attributs requis sont disponibles
-        if not hasattr(self, 'console'):
-            from rich.console import Console
-            self.console = Console()
-            print("[WARNING] L'attribut 'console' n'était pas disponible et a été créé dynamiquement.")
-        # Définir la langue par défaut si non spécifiée
-        if not hasattr(self, 'lang'):
-            self.lang = "fr"
+        # Vérification unique des attributs requis (show_stats/show_errors s'appuient dessus)
+        self._ensure_runtime_state()
             
         if not self.config:
             self.console.print("[bold red]Impossible de lancer l'interface interactive sans configuration valide.[/bold red]")
             return
             
-        self.console.print(get_translation("startup_message", self.lang))
+        # Textes de la langue de la session, utilisés dans tout le menu
+        lang = self.lang
+        t = message_table(lang)
+        
+        self.console.print(get_rich("startup_message", lang))
 
-        self.console.print(f"[bold red]DEBUG INTERACTIVE: self.run_download_sources est {self.run_download_sources}[/bold red]")
-        import inspect
-        try:
-            self.console.print(f"[bold red]DEBUG INTERACTIVE: Fichier de self.run_download_sources: {inspect.getfile(self.run_download_sources)}[/bold red]")
-        except TypeError:
-            self.console.print(f"[bold red]DEBUG INTERACTIVE: Impossible d'obtenir le fichier pour self.run_download_sources (pourrait être une méthode C ou non trouvée).[/bold red]")
+        # Diagnostics uniquement sur demande (inspect.getfile lit le système de fichiers)
+        if os.environ.get("AGGREGATOR_DEBUG_INTERACTIVE"):
+            import inspect
+            self.console.print(f"[bold red]DEBUG INTERACTIVE: self.run_download_sources est {self.run_download_sources}[/bold red]")
+            try:
+                self.console.print(f"[bold red]DEBUG INTERACTIVE: Fichier de self.run_download_sources: {inspect.getfile(self.run_download_sources)}[/bold red]")
+            except TypeError:
+                self.console.print(f"[bold red]DEBUG INTERACTIVE: Impossible d'obtenir le fichier pour self.run_download_sources (pourrait être une méthode C ou non trouvée).[/bold red]")
+    
+        # Les menus ne dépendent que de la langue : construits une fois puis mis en cache
+        panel_auto, panel_man = self._menu_panels(lang)
+    
+        # Textes affichés à chaque tour de boucle
+        prompt = t[MsgId.enter_choice]
+        invalid_message = Text.from_markup(f"[bold red]{t[MsgId.invalid_choice]}[/bold red]")
+    
+        # Table des actions du menu, indexée par le numéro du choix (le choix 0 quitte la boucle)
+        actions: Tuple[Optional[Callable[[], Any]], ...] = (
+            None,
+            # Menu automatique
+            self._run_auto_all,
+            functools.partial(self._run_auto_pipeline_safe, "Export des pseudonymes", self.run_export_nicknames),
+            functools.partial(self._run_auto_pipeline_safe, "Export des emails", self.run_export_emails),
+            functools.partial(self._run_auto_pipeline_safe, "Export des mots de passe", self.run_export_passwords),
+            # Menu manuel
+            self.run_download_sources,
+            self.run_export_all,
+            self.run_split_deduped,
+            self.run_export_nicknames,
+            self.run_export_emails,
+            self.run_export_passwords,
+            self._clear_and_reload,
+            self.show_stats,
+        )
     
         while True:
             # Affichage du menu interactif principal
             # Ajout d'une ligne vide avant le panel
             self.console.print()
             
-            # Affichage du menu automatique
-            panel_auto = Panel.fit(
-                get_translation("auto_menu_title", self.lang) +
-                get_translation("auto_option_1", self.lang) + "\n" +
-                get_translation("auto_option_2", self.lang) + "\n" +
-                get_translation("auto_option_3", self.lang) + "\n" +
-                get_translation("auto_option_4", self.lang) + "\n" +
-                get_translation("auto_option_0", self.lang),
-                title=get_translation("panel_title", self.lang),
-                border_style="green"
-            )
+            # Affichage du menu automatique puis du menu manuel
             self.console.print(panel_auto)
-
-            # Affichage du menu manuel
-            panel_man = Panel.fit(
-                get_translation("manual_menu_title", self.lang) +
-                get_translation("manual_option_5", self.lang) + "\n" +
-                get_translation("manual_option_7", self.lang) + "\n" +
-                get_translation("manual_option_6", self.lang) + "\n" +
-                get_translation("manual_option_8", self.lang) + "\n" +
-                get_translation("manual_option_9", self.lang) + "\n" +
-                get_translation("manual_option_10", self.lang) + "\n" +
-                get_translation("manual_option_11", self.lang) + "\n" +
-                get_translation("manual_option_12", self.lang) + "\n" +
-                get_translation("manual_option_0", self.lang),
-                title=get_translation("panel_title", self.lang),
-                border_style="cyan"
-            )
             self.console.print(panel_man)
 
             # Saisie utilisateur sécurisée avec traduction
-            choice = input(get_translation("enter_choice", self.lang))
+            choice = await self._ainput(prompt)
 
-            # Traitement du choix utilisateur pour les deux menus fusionnés
-            if choice == "0":
-                self.console.print(get_translation("goodbye_message", self.lang))
+            # Traitement du choix utilisateur pour les deux menus fusionnés :
+            # seuls les chiffres ASCII sont acceptés, le numéro indexe directement la table
+            number = int(choice) if choice.isascii() and choice.isdigit() else -1
+            if number == 0:
+                self.console.print(get_rich("goodbye_message", lang))
                 break
-            elif choice == "1":
-                # Menu automatique - exécute toutes les étapes nécessaires
-                try:
-                    # Réinitialiser le log d'erreurs au début du processus automatique
-                    self.errors_log = []
-                    # Étape 1: Nettoyage du projet (obligatoire)
-                    self.console.print("[bold yellow]Étape 1/7 : Nettoyage complet du projet...[/bold yellow]")
-                    await self.run_clear_project_strict()
-                    
-                    
-                    # Étape 2: Téléchargement des sources (obligatoire)
-                    self.console.print("[bold yellow]Étape 2/7 : Téléchargement des sources...[/bold yellow]")
-                    self.console.print("[bold magenta]DEBUG INTERACTIVE: JUSTE APRÈS L'AFFICHAGE DE L'ÉTAPE 2/7 (Processus Auto)[/bold magenta]")
-                    await self.run_download_sources()
-                    
-                    # Vérifier si des sources ont été téléchargées
-                    if self.stats['sources_downloaded'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune source n'a été téléchargée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 3: Normalisation des données (obligatoire)
-                    self.console.print("[bold yellow]Étape 3/7 : Normalisation des données...[/bold yellow]")
-                    await self.run_normalize()
-                    
-                    # Vérifier si des données ont été normalisées
-                    if self.stats['entries_normalized'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune donnée n'a été normalisée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 4: Création des chunks (peut échouer si pas de données normalisées)
-                    self.console.print("[bold yellow]Étape 4/7 : Création des chunks depuis les données normalisées...[/bold yellow]")
-                    # Vérifier d'abord si des données normalisées existent
-                    if not self.normalized_dir.exists() or not any(self.normalized_dir.glob("*.*")):
-                        self.console.print("[bold red]Erreur : Aucune donnée normalisée trouvée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_normalized()
-                    
-                    # Étape 5: Déduplication (peut échouer si pas de chunks)
-                    self.console.print("[bold yellow]Étape 5/7 : Déduplication des chunks...[/bold yellow]")
-                    split_dir = self.output_dir / "splits"
-                    if not split_dir.exists() or not any(split_dir.glob("*.txt")):
-                        self.console.print("[bold red]Erreur : Aucun chunk à dédupliquer. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_deduplicate()
-                    
-                    # Vérifier si la déduplication a produit des résultats
-                    if self.stats['entries_deduped'] == 0:
-                        self.console.print("[bold red]Erreur : La déduplication n'a produit aucun résultat. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 6: Export des données (peut continuer même en cas d'échec)
-                    self.console.print("[bold yellow]Étape 6/7 : Export des données...[/bold yellow]")
-                    await self.run_export_all()  # Exporte tous les types de données
-                    
-                    # Étape 7: Division du fichier dédupliqué (peut échouer si pas de fichier dédupliqué)
-                    self.console.print("[bold yellow]Étape 7/7 : Division du fichier dédupliqué...[/bold yellow]")
-                    if not self.deduped_path or not self.deduped_path.exists():
-                        self.console.print("[bold red]Erreur : Aucun fichier dédupliqué trouvé. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_deduped(auto_mode=True)
-                    
-                    # Afficher les statistiques à la fin du processus
-                    self.console.print("[bold green]✓ Processus automatique complet terminé avec succès ![/bold green]")
-                    self.show_stats()
-                except Exception as e:
-                    self.console.print(f"[bold red]Erreur inattendue lors du processus automatique : {str(e)}[/bold red]")
-                    self.console.print("[bold red]Le processus automatique a été interrompu en raison d'une erreur.[/bold red]")
-            elif choice == "2":
-                # Menu automatique - export pseudonymes
-                try:
-                    # Étape 1: Nettoyage du projet (obligatoire)
-                    self.console.print("[bold yellow]Étape 1/7 : Nettoyage complet du projet...[/bold yellow]")
-                    await self.run_clear_project_strict()
-                    
-                    
-                    # Étape 2: Téléchargement des sources (obligatoire)
-                    self.console.print("[bold yellow]Étape 2/7 : Téléchargement des sources...[/bold yellow]")
-                    await self.run_download_sources()
-                    
-                    # Vérifier si des sources ont été téléchargées
-                    if self.stats['sources_downloaded'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune source n'a été téléchargée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 3: Normalisation des données (obligatoire)
-                    self.console.print("[bold yellow]Étape 3/7 : Normalisation des données...[/bold yellow]")
-                    await self.run_normalize()
-                    
-                    # Vérifier si des données ont été normalisées
-                    if self.stats['entries_normalized'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune donnée n'a été normalisée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 4: Création des chunks (peut échouer si pas de données normalisées)
-                    self.console.print("[bold yellow]Étape 4/7 : Création des chunks depuis les données normalisées...[/bold yellow]")
-                    # Vérifier d'abord si des données normalisées existent
-                    if not self.normalized_dir.exists() or not any(self.normalized_dir.glob("*.*")):
-                        self.console.print("[bold red]Erreur : Aucune donnée normalisée trouvée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_normalized()
-                    
-                    # Étape 5: Déduplication (peut échouer si pas de chunks)
-                    self.console.print("[bold yellow]Étape 5/7 : Déduplication des chunks...[/bold yellow]")
-                    split_dir = self.output_dir / "splits"
-                    if not split_dir.exists() or not any(split_dir.glob("*.txt")):
-                        self.console.print("[bold red]Erreur : Aucun chunk à dédupliquer. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_deduplicate()
-                    
-                    # Vérifier si la déduplication a produit des résultats
-                    if self.stats['entries_deduped'] == 0:
-                        self.console.print("[bold red]Erreur : La déduplication n'a produit aucun résultat. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 6: Export des pseudonymes (peut continuer même en cas d'échec)
-                    self.console.print("[bold yellow]Étape 6/7 : Export des pseudonymes...[/bold yellow]")
-                    await self.run_export_nicknames()
-                    
-                    # Étape 7: Division du fichier dédupliqué (peut échouer si pas de fichier dédupliqué)
-                    self.console.print("[bold yellow]Étape 7/7 : Division du fichier dédupliqué...[/bold yellow]")
-                    if not self.deduped_path or not self.deduped_path.exists():
-                        self.console.print("[bold red]Erreur : Aucun fichier dédupliqué trouvé. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_deduped(auto_mode=True)
-                    
-                    # Afficher les statistiques à la fin du processus
-                    self.console.print("[bold green]✓ Processus automatique complet terminé avec succès ![/bold green]")
-                    self.show_stats()
-                except Exception as e:
-                    self.console.print(f"[bold red]Erreur inattendue lors du processus automatique : {str(e)}[/bold red]")
-                    self.console.print("[bold red]Le processus automatique a été interrompu en raison d'une erreur.[/bold red]")
-            elif choice == "3":
-                # Menu automatique - export emails
-                try:
-                    # Étape 1: Nettoyage du projet (obligatoire)
-                    self.console.print("[bold yellow]Étape 1/7 : Nettoyage complet du projet...[/bold yellow]")
-                    await self.run_clear_project_strict()
-                    
-                    
-                    # Étape 2: Téléchargement des sources (obligatoire)
-                    self.console.print("[bold yellow]Étape 2/7 : Téléchargement des sources...[/bold yellow]")
-                    await self.run_download_sources()
-                    
-                    # Vérifier si des sources ont été téléchargées
-                    if self.stats['sources_downloaded'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune source n'a été téléchargée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 3: Normalisation des données (obligatoire)
-                    self.console.print("[bold yellow]Étape 3/7 : Normalisation des données...[/bold yellow]")
-                    await self.run_normalize()
-                    
-                    # Vérifier si des données ont été normalisées
-                    if self.stats['entries_normalized'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune donnée n'a été normalisée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 4: Création des chunks (peut échouer si pas de données normalisées)
-                    self.console.print("[bold yellow]Étape 4/7 : Création des chunks depuis les données normalisées...[/bold yellow]")
-                    # Vérifier d'abord si des données normalisées existent
-                    if not self.normalized_dir.exists() or not any(self.normalized_dir.glob("*.*")):
-                        self.console.print("[bold red]Erreur : Aucune donnée normalisée trouvée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_normalized()
-                    
-                    # Étape 5: Déduplication (peut échouer si pas de chunks)
-                    self.console.print("[bold yellow]Étape 5/7 : Déduplication des chunks...[/bold yellow]")
-                    split_dir = self.output_dir / "splits"
-                    if not split_dir.exists() or not any(split_dir.glob("*.txt")):
-                        self.console.print("[bold red]Erreur : Aucun chunk à dédupliquer. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_deduplicate()
-                    
-                    # Vérifier si la déduplication a produit des résultats
-                    if self.stats['entries_deduped'] == 0:
-                        self.console.print("[bold red]Erreur : La déduplication n'a produit aucun résultat. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 6: Export des emails (peut continuer même en cas d'échec)
-                    self.console.print("[bold yellow]Étape 6/7 : Export des emails...[/bold yellow]")
-                    await self.run_export_emails()
-                    
-                    # Étape 7: Division du fichier dédupliqué (peut échouer si pas de fichier dédupliqué)
-                    self.console.print("[bold yellow]Étape 7/7 : Division du fichier dédupliqué...[/bold yellow]")
-                    if not self.deduped_path or not self.deduped_path.exists():
-                        self.console.print("[bold red]Erreur : Aucun fichier dédupliqué trouvé. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_deduped(auto_mode=True)
-                    
-                    # Afficher les statistiques à la fin du processus
-                    self.console.print("[bold green]✓ Processus automatique complet terminé avec succès ![/bold green]")
-                    self.show_stats()
-                except Exception as e:
-                    self.console.print(f"[bold red]Erreur inattendue lors du processus automatique : {str(e)}[/bold red]")
-                    self.console.print("[bold red]Le processus automatique a été interrompu en raison d'une erreur.[/bold red]")
-            elif choice == "4":
-                # Menu automatique - export mots de passe
-                try:
-                    # Étape 1: Nettoyage du projet (obligatoire)
-                    self.console.print("[bold yellow]Étape 1/7 : Nettoyage complet du projet...[/bold yellow]")
-                    await self.run_clear_project_strict()
-                    
-                    
-                    # Étape 2: Téléchargement des sources (obligatoire)
-                    self.console.print("[bold yellow]Étape 2/7 : Téléchargement des sources...[/bold yellow]")
-                    await self.run_download_sources()
-                    
-                    # Vérifier si des sources ont été téléchargées
-                    if self.stats['sources_downloaded'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune source n'a été téléchargée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 3: Normalisation des données (obligatoire)
-                    self.console.print("[bold yellow]Étape 3/7 : Normalisation des données...[/bold yellow]")
-                    await self.run_normalize()
-                    
-                    # Vérifier si des données ont été normalisées
-                    if self.stats['entries_normalized'] == 0:
-                        self.console.print("[bold red]Erreur : Aucune donnée n'a été normalisée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 4: Création des chunks (peut échouer si pas de données normalisées)
-                    self.console.print("[bold yellow]Étape 4/7 : Création des chunks depuis les données normalisées...[/bold yellow]")
-                    # Vérifier d'abord si des données normalisées existent
-                    if not self.normalized_dir.exists() or not any(self.normalized_dir.glob("*.*")):
-                        self.console.print("[bold red]Erreur : Aucune donnée normalisée trouvée. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_normalized()
-                    
-                    # Étape 5: Déduplication (peut échouer si pas de chunks)
-                    self.console.print("[bold yellow]Étape 5/7 : Déduplication des chunks...[/bold yellow]")
-                    split_dir = self.output_dir / "splits"
-                    if not split_dir.exists() or not any(split_dir.glob("*.txt")):
-                        self.console.print("[bold red]Erreur : Aucun chunk à dédupliquer. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_deduplicate()
-                    
-                    # Vérifier si la déduplication a produit des résultats
-                    if self.stats['entries_deduped'] == 0:
-                        self.console.print("[bold red]Erreur : La déduplication n'a produit aucun résultat. Processus automatique interrompu.[/bold red]")
-                        continue
-                    
-                    # Étape 6: Export des mots de passe (peut continuer même en cas d'échec)
-                    self.console.print("[bold yellow]Étape 6/7 : Export des mots de passe...[/bold yellow]")
-                    await self.run_export_passwords()  # Exporter passwords (auto)
-                    
-                    # Étape 7: Division du fichier dédupliqué (peut échouer si pas de fichier dédupliqué)
-                    self.console.print("[bold yellow]Étape 7/7 : Division du fichier dédupliqué...[/bold yellow]")
-                    if not self.deduped_path or not self.deduped_path.exists():
-                        self.console.print("[bold red]Erreur : Aucun fichier dédupliqué trouvé. Processus automatique interrompu.[/bold red]")
-                        continue
-                    await self.run_split_deduped(auto_mode=True)
-                    
-                    # Afficher les statistiques à la fin du processus
-                    self.console.print("[bold green]✓ Processus automatique complet terminé avec succès ![/bold green]")
-                    self.show_stats()
-                except Exception as e:
-                    self.console.print(f"[bold red]Erreur inattendue lors du processus automatique : {str(e)}[/bold red]")
-                    self.console.print("[bold red]Le processus automatique a été interrompu en raison d'une erreur.[/bold red]")
-            elif choice == "5":
-                await self.run_download_sources()  # Télécharger tout (manuel)
-            elif choice == "7":
-                await self.run_split_deduped()  # Split/dedup (manuel)
-            elif choice == "6":
-                await self.run_export_all()  # Exporter tout (manuel)
-            elif choice == "8":
-                await self.run_export_nicknames()  # Exporter nicknames (manuel)
-            elif choice == "9":
-                await self.run_export_emails()  # Exporter emails (manuel)
-            elif choice == "10":
-                await self.run_export_passwords()  # Exporter passwords (manuel)
-            elif choice == "11":
-                await self.run_clear_project_strict()  # Nettoyer entièrement le projet (manuel)
-                # Recharger la configuration après le nettoyage manuel aussi
-                await self.reload_config()
-            elif choice == "12":
-                self.show_stats()  # Afficher les statistiques
-            else:
+            action = actions[number] if 0 < number < len(actions) else None
+            if action is None:
                 # Afficher un message d'erreur et continuer la boucle
-                self.console.print(f"[bold red]{get_translation('invalid_choice', self.lang)}[/bold red]")
-                # Ne rien faire d'autre - la boucle continuera et réaffichera le menu
-                
+                self.console.print(invalid_message)
+                continue
+            result = action()
+            if asyncio.iscoroutine(result):
+                await result
 
-                
+    async def _run_auto_all(self) -> None:
+        """Processus automatique complet avec export de toutes les données (choix 1)."""
+        # Réinitialiser le log d'erreurs au début du processus automatique
+        self.errors_log = []
+        await self._run_auto_pipeline_safe("Export des données", self.run_export_all)
 
-    
-    def show_stats(self) -> None:
+    async def _clear_and_reload(self) -> None:
+        """Nettoie entièrement le projet puis recharge la configuration (choix 11)."""
+        await self.run_clear_project_strict()
+        # Recharger la configuration après le nettoyage manuel aussi
+        await self.reload_config()
+
+    def _menu_panels(self, lang: str) -> Tuple[Panel, Panel]:
         """
-        Affiche les statistiques actuelles de l'orchestrateur.
+        Retourne les panneaux des menus automatique et manuel pour une langue,
+        construits au premier appel puis conservés dans un cache par langue.
+        Les textes sont convertis en rich.text.Text pour ne pas relire le balisage à chaque affichage.
         
-        Requires:
-            - self.console: Instance de rich.console.Console (fournie par OrchestratorBase)
-            - self.stats: Dictionnaire des statistiques (fourni par OrchestratorBase)
-            - self.lang: Code de langue (fourni par interactive_runner)
+        Args:
+            lang: Code de langue
+            
+        Returns:
+            Tuple[Panel, Panel]: Panneau du menu automatique, panneau du menu manuel
+        """
+        cache: Optional[Dict[str, Tuple[Panel, Panel]]] = getattr(self, '_menu_panel_cache', None)
+        if cache is None:
+            cache = self._menu_panel_cache = {}
+        panels = cache.get(lang)
+        if panels is None:
+            title = get_rich("panel_title", lang)
+            panels = (
+                Panel.fit(
+                    Text.from_markup(get_rendered("auto_menu", lang)),
+                    title=title,
+                    border_style="green"
+                ),
+                Panel.fit(
+                    Text.from_markup(get_rendered("manual_menu", lang)),
+                    title=title,
+                    border_style="cyan"
+                ),
+            )
+            cache[lang] = panels
+        return panels
+
+    @staticmethod
+    async def _ainput(prompt: str) -> str:
+        """input() exécuté dans un thread pour ne pas bloquer la boucle d'événements pendant la saisie."""
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+    async def _run_auto_pipeline_safe(
+        self,
+        export_label: str,
+        export: Callable[[], Awaitable[None]],
+        lines_per_file: int = DEFAULT_LINES_PER_FILE
+    ) -> None:
+        """
+        Lance le processus automatique et affiche toute erreur inattendue sans quitter le menu.
+        
+        Args:
+            export_label: Libellé de l'étape d'export affiché à l'étape 6
+            export: Coroutine d'export à exécuter à l'étape 6
+            lines_per_file: Nombre de lignes par fichier pour la division finale (étape 7)
+        """
+        try:
+            await self._run_auto_pipeline(export_label, export, lines_per_file)
+        except Exception as e:
+            self.console.print(f"[bold red]Erreur inattendue lors du processus automatique : {str(e)}[/bold red]")
+            self.console.print("[bold red]Le processus automatique a été interrompu en raison d'une erreur.[/bold red]")
+
+    async def _run_auto_pipeline(
+        self,
+        export_label: str,
+        export: Callable[[], Awaitable[None]],
+        lines_per_file: int = DEFAULT_LINES_PER_FILE
+    ) -> None:
+        """
+        Exécute les 7 étapes du processus automatique : nettoyage, téléchargement,
+        normalisation, chunks, déduplication, export puis division du fichier dédupliqué.
+        S'arrête dès qu'une étape ne produit aucun résultat.
+        
+        Args:
+            export_label: Libellé de l'étape d'export affiché à l'étape 6
+            export: Coroutine d'export à exécuter à l'étape 6
+            lines_per_file: Nombre de lignes par fichier pour la division finale (étape 7)
+        """
+        stats = self.stats
+        steps = (
+            # Étape 1: Nettoyage du projet (obligatoire)
+            _AutoStep("Nettoyage complet du projet", self.run_clear_project_strict),
+            # Étape 2: Téléchargement des sources (obligatoire)
+            _AutoStep(
+                "Téléchargement des sources", self.run_download_sources,
+                after=(lambda: stats['sources_downloaded'] > 0, "Aucune source n'a été téléchargée")
+            ),
+            # Étape 3: Normalisation des données (obligatoire)
+            _AutoStep(
+                "Normalisation des données", self.run_normalize,
+                after=(lambda: stats['entries_normalized'] > 0, "Aucune donnée n'a été normalisée")
+            ),
+            # Étape 4: Création des chunks (peut échouer si pas de données normalisées)
+            _AutoStep(
+                "Création des chunks depuis les données normalisées", self.run_split_normalized,
+                before=(lambda: self._dir_nonempty(self.normalized_dir), "Aucune donnée normalisée trouvée")
+            ),
+            # Étape 5: Déduplication (peut échouer si pas de chunks)
+            _AutoStep(
+                "Déduplication des chunks", self.run_deduplicate,
+                before=(lambda: self._dir_nonempty(self.output_dir / "splits", ".txt"), "Aucun chunk à dédupliquer"),
+                after=(lambda: stats['entries_deduped'] > 0, "La déduplication n'a produit aucun résultat")
+            ),
+            # Étape 6: Export (peut continuer même en cas d'échec)
+            _AutoStep(export_label, export),
+            # Étape 7: Division du fichier dédupliqué (peut échouer si pas de fichier dédupliqué)
+            _AutoStep(
+                "Division du fichier dédupliqué", functools.partial(self.run_split_deduped, auto_mode=True, lines_per_file=lines_per_file),
+                before=(
+                    lambda: self.deduped_path is not None and self.deduped_path.exists(),
+                    "Aucun fichier dédupliqué trouvé"
+                )
+            ),
+        )
+        
+        # Console liée une fois en variable locale pour toutes les étapes
+        console = self.console
+        for number, step in enumerate(steps, 1):
+            console.print(f"[bold yellow]Étape {number}/{len(steps)} : {step.label}...[/bold yellow]")
+            if step.before is not None and not step.before[0]():
+                self._stage_failed(step.before[1])
+                return
+            await step.run()
+            if step.after is not None and not step.after[0]():
+                self._stage_failed(step.after[1])
+                return
+        
+        # Afficher les statistiques à la fin du processus
+        console.print("[bold green]✓ Processus automatique complet terminé avec succès ![/bold green]")
+        self.show_stats()
+
+    def _stage_failed(self, message: str) -> None:
+        """Affiche l'interruption du processus automatique avec la cause donnée."""
+        self.console.print(f"[bold red]Erreur : {message}. Processus automatique interrompu.[/bold red]")
+
+    @staticmethod
+    def _dir_nonempty(directory: Path, suffix: Optional[str] = None) -> bool:
+        """
+        Indique si directory contient au moins un fichier (se terminant par suffix si fourni).
+        Parcours os.scandir interrompu au premier fichier trouvé, sans objet Path par entrée.
+        """
+        try:
+            with os.scandir(directory) as it:
+                return any(
+                    entry.is_file() and (suffix is None or entry.name.endswith(suffix))
+                    for entry in it
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def _ensure_runtime_state(self) -> None:
+        """
+        Crée une seule fois, au lancement de l'interface, les attributs attendus
+        d'OrchestratorBase qui seraient absents (console, langue, statistiques, erreurs).
         """
-        # Vérification que les attributs requis sont disponibles
         if not hasattr(self, 'console'):
-            from rich.console import Console
             self.console = Console()
             print("[WARNING] L'attribut 'console' n'était pas disponible et a été créé dynamiquement.")
-            
+        # Définir la langue par défaut si non spécifiée
+        if not hasattr(self, 'lang'):
+            self.lang = "fr"
         if not hasattr(self, 'stats'):
             self.stats = {
                 'sources_downloaded': 0,
@@ -478,15 +365,29 @@ class InteractiveMixin:
                 'entries_deduped': 0
             }
             print("[WARNING] L'attribut 'stats' n'était pas disponible et a été créé dynamiquement.")
-        table = Table(title=get_translation("stats_title", self.lang))
+        if not hasattr(self, 'errors_log'):
+            self.errors_log = []
+            print("[WARNING] L'attribut 'errors_log' n'était pas disponible et a été créé dynamiquement.")
+
+    def show_stats(self) -> None:
+        """
+        Affiche les statistiques actuelles de l'orchestrateur.
+        
+        Requires:
+            - self.console: Instance de rich.console.Console (fournie par OrchestratorBase)
+            - self.stats: Dictionnaire des statistiques (fourni par OrchestratorBase)
+            - self.lang: Code de langue (fourni par interactive_runner)
+        
+        Ces attributs sont garantis par _ensure_runtime_state, appelé au lancement de run_interactive.
+        """
+        t = message_table(self.lang)
+        table = Table(title=t[MsgId.stats_title])
         
-        table.add_column(get_translation("stats_column_1", self.lang), style="magenta")  # Couleur différente pour les statistiques
-        table.add_column(get_translation("stats_column_2", self.lang), style="magenta")
+        table.add_column(t[MsgId.stats_column_1], style="magenta")  # Couleur différente pour les statistiques
+        table.add_column(t[MsgId.stats_column_2], style="magenta")
         
-        table.add_row(get_translation("stats_row_1", self.lang), str(self.stats['sources_downloaded']))
-        table.add_row(get_translation("stats_row_2", self.lang), str(self.stats['entries_raw']))
-        table.add_row(get_translation("stats_row_3", self.lang), str(self.stats['entries_normalized']))
-        table.add_row(get_translation("stats_row_4", self.lang), str(self.stats['entries_deduped']))
+        for label_id, stat_key in _STATS_ROWS:
+            table.add_row(t[label_id], str(self.stats[stat_key]))
         
         self.console.print(table)
         
@@ -498,38 +399,31 @@ class InteractiveMixin:
             - self.console: Instance de rich.console.Console (fournie par OrchestratorBase)
             - self.errors_log: Liste des erreurs (fournie par OrchestratorBase)
             - self.lang: Code de langue (fourni par interactive_runner)
-        """
-        # Vérification que les attributs requis sont disponibles
-        if not hasattr(self, 'console'):
-            from rich.console import Console
-            self.console = Console()
-            print("[WARNING] L'attribut 'console' n'était pas disponible et a été créé dynamiquement.")
-            
-        if not hasattr(self, 'errors_log'):
-            self.errors_log = []
-            print("[WARNING] L'attribut 'errors_log' n'était pas disponible et a été créé dynamiquement.")
         
+        Ces attributs sont garantis par _ensure_runtime_state, appelé au lancement de run_interactive.
+        """
         # Si aucune erreur n'a été enregistrée, afficher un message simple
+        t = message_table(self.lang)
         if not self.errors_log:
-            self.console.print(f"[bold green]{get_translation('no_errors', self.lang)}[/bold green]")
+            self.console.print(f"[bold green]{t[MsgId.no_errors]}[/bold green]")
             return
         
         # Créer un tableau pour afficher les erreurs
-        table = Table(title=get_translation("errors_title", self.lang))
+        table = Table(title=t[MsgId.errors_title])
         
         # Ajouter les colonnes
-        table.add_column(get_translation("errors_column_time", self.lang), style="cyan")
-        table.add_column(get_translation("errors_column_phase", self.lang), style="blue")
-        table.add_column(get_translation("errors_column_type", self.lang), style="yellow")
-        table.add_column(get_translation("errors_column_message", self.lang), style="red")
+        table.add_column(t[MsgId.errors_column_time], style="cyan")
+        table.add_column(t[MsgId.errors_column_phase], style="blue")
+        table.add_column(t[MsgId.errors_column_type], style="yellow")
+        table.add_column(t[MsgId.errors_column_message], style="red")
         
         # Ajouter les lignes d'erreurs
         for error in self.errors_log:
             table.add_row(
-                error.get('time', '-'),
-                error.get('phase', '-'),
-                error.get('type', '-'),
-                error.get('message', '-')
+                error.time,
+                error.phase,
+                error.type,
+                error.message
             )
         
         self.console.print(table)
@@ -4,14 +4,93 @@ Contient toutes les fonctions liées à la division des fichiers bruts et dédup
 """
 
 import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Any, BinaryIO, Callable, Deque, Iterator, Optional, Dict, Tuple
 from rich.console import Console
 
 from ..split_raw import split_raw_files
 # Correction : le module de déduplication s'appelle 'dedupe.py' (et non 'deduplication.py').
 # La fonction deduplicate_chunks est définie dans aggregator/dedupe.py.
 from ..dedupe import deduplicate_chunks
+from .translations import MsgId, message_table
+
+
+# Nombre de lignes par fichier proposé par défaut lors de la division du fichier dédupliqué
+DEFAULT_LINES_PER_FILE = 1_000_000
+# Taille des lectures lors de la division du fichier dédupliqué
+SPLIT_READ_SIZE = 16 * 1024 * 1024
+# Nombre maximal de chunks en attente d'écriture (borne la mémoire utilisée)
+SPLIT_MAX_PENDING = 4
+# Espaces ASCII (hors \n) que str.strip() retire, tous remplacés par \x00 pour les repérer en une passe
+_ASCII_SPACES = bytes.maketrans(b'\t\x0b\x0c\x1c\x1d\x1e\x1f ', b'\x00' * 8)
+
+
+def _clean_block(block: bytes) -> bytes:
+    """
+    Applique str.strip() à chaque ligne d'un bloc de lignes complètes.
+    Chemin rapide : un bloc ASCII sans \r ni espace en début ou fin de ligne est
+    renvoyé tel quel ; sinon les lignes sont décodées et nettoyées une à une.
+    """
+    if block.isascii():
+        marked = block.translate(_ASCII_SPACES)
+        if (b'\r' not in block and b'\x00\n' not in marked
+                and b'\n\x00' not in marked and not marked.startswith(b'\x00')):
+            return block
+    # Mêmes fins de ligne que la lecture en mode texte (\r\n et \r deviennent \n)
+    text = block.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    # Le bloc finit par \n : le dernier élément vide de split fournit le \n final sans concaténation
+    return '\n'.join([line.strip() for line in text.split('\n')]).encode('utf-8')
+
+
+def _iter_clean_blocks(path: Path) -> Iterator[bytes]:
+    """
+    Lit path par blocs de SPLIT_READ_SIZE octets et produit des blocs de lignes complètes,
+    nettoyées et terminées par \n (y compris la dernière ligne du fichier).
+    """
+    carry = b''
+    # Lectures de SPLIT_READ_SIZE octets : un tampon intermédiaire n'apporterait qu'une copie de plus
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            data = f.read(SPLIT_READ_SIZE)
+            if not data:
+                break
+            start = 0
+            if carry:
+                # Compléter la ligne coupée sans recopier tout le bloc lu
+                first = data.find(b'\n') + 1
+                if not first:
+                    carry += data
+                    continue
+                yield _clean_block(carry + data[:first])
+                start = first
+            cut = data.rfind(b'\n') + 1
+            carry = data[cut:]
+            if cut > start:
+                yield _clean_block(data[start:cut] if start or cut < len(data) else data)
+    if carry:
+        yield _clean_block(carry + b'\n')
+
+
+def _nth_line_end(block: bytes, n: int, start: int = 0) -> int:
+    """
+    Position juste après la n-ième fin de ligne de block à partir de start
+    (recherche dichotomique avec bytes.count, puis find sur le dernier petit intervalle).
+    """
+    lo, hi, seen = start, len(block), 0
+    while hi - lo > 4096:
+        mid = (lo + hi) // 2
+        found = block.count(b'\n', lo, mid)
+        if seen + found >= n:
+            hi = mid
+        else:
+            seen += found
+            lo = mid
+    pos = lo - 1
+    for _ in range(n - seen):
+        pos = block.find(b'\n', pos + 1)
+    return pos + 1
 
 
 class SplittingMixin:
@@ -36,34 +115,37 @@ class SplittingMixin:
             return
             
         self.console.print("\n[bold blue]Scission des fichiers normalisés en chunks de 5M lignes...[/bold blue]")
-        split_raw_files(
+        # Exécuté dans un thread pour ne pas bloquer la boucle d'événements pendant la scission
+        await asyncio.to_thread(
+            split_raw_files,
             input_dir=self.normalized_dir,  # Utiliser les données normalisées au lieu des données brutes
             output_dir=self.output_dir / "splits",
             max_lines=5_000_000,
             console=self.console
         )
     
-    async def run_split_deduped(self, auto_mode: bool = False):
+    async def run_split_deduped(self, auto_mode: bool = False, lines_per_file: Optional[int] = None):
         """
         Scinde le fichier des données dédupliquées en plusieurs fichiers par taille.
         
         Args:
             auto_mode: Si True, utilise automatiquement 1 000 000 lignes sans demander à l'utilisateur.
                       Si False, demande à l'utilisateur le nombre de lignes souhaité par fichier.
+            lines_per_file: Nombre de lignes par fichier fourni directement par l'appelant.
+                      Si renseigné, aucune question n'est posée à l'utilisateur.
         """
         # Si pas de fichier dédupliqué, tenter une déduplication automatique si des chunks bruts existent
         if not self.deduped_path or not self.deduped_path.exists():
             split_dir = self.output_dir / "splits"
             if split_dir.exists() and any(split_dir.glob("*.txt")):
                 self.console.print("[yellow]Aucun fichier dédupliqué trouvé, lancement de la déduplication automatique...[/yellow]")
-                final_path = await asyncio.to_thread(
+                final_path, count = await asyncio.to_thread(
                     deduplicate_chunks,
                     split_dir,
                     self.deduped_dir / "deduped_chunks.txt",
                     self.console
                 )
                 self.deduped_path = final_path
-                count = sum(1 for _ in open(final_path, "r", encoding="utf-8"))
                 self.stats['entries_deduped'] = count
                 self.console.print(f"[green]Entrées uniques après chunks : {count}[/green]")
             else:
@@ -73,19 +155,26 @@ class SplittingMixin:
         self.console.print("\n[bold blue]Division du fichier dédupliqué en fichiers plus petits...[/bold blue]")
         
         # Définir le nombre de lignes par fichier
-        default_chunk_size = 1_000_000
+        default_chunk_size = DEFAULT_LINES_PER_FILE
         chunk_size = default_chunk_size
         
+        # Valeur fournie par l'appelant : pas d'invite utilisateur
+        if lines_per_file is not None:
+            if lines_per_file > 0:
+                chunk_size = lines_per_file
+                prefix = "Mode automatique : utilisation" if auto_mode else "Utilisation"
+                self.console.print(f"[green]{prefix} de {chunk_size:,} lignes par fichier.[/green]")
+            else:
+                self.console.print(f"[yellow]Valeur incorrecte. Utilisation de la valeur par défaut : {default_chunk_size:,} lignes par fichier.[/yellow]")
         # En mode automatique, utiliser directement la valeur par défaut
-        if auto_mode:
+        elif auto_mode:
             self.console.print(f"[green]Mode automatique : utilisation de {chunk_size:,} lignes par fichier.[/green]")
         else:
             # Demander à l'utilisateur le nombre de lignes par fichier
             self.console.print(f"\n[bold]Par défaut, chaque fichier contiendra {default_chunk_size:,} lignes.[/bold]")
             # Utiliser le système de traductions pour l'invite utilisateur
-            from .translations import get_translation
             lang = getattr(self, 'lang', 'fr')  # Récupérer la langue ou utiliser fr par défaut
-            user_input = input(get_translation("modify_lines_per_file", lang))
+            user_input = input(message_table(lang)[MsgId.modify_lines_per_file])
             
             # Traiter l'entrée de l'utilisateur
             if user_input.strip():
@@ -105,47 +194,81 @@ class SplittingMixin:
         final_dir = self.output_dir / "final"
         final_dir.mkdir(parents=True, exist_ok=True)
         
-        # Lire le fichier dédupliqué et le diviser en morceaux selon la taille choisie
-        with open(self.deduped_path, "r", encoding="utf-8") as f:
-            lines: List[str] = []
-            last_idx = 0
-            total_lines = sum(1 for _ in open(self.deduped_path, "r", encoding="utf-8"))
-            
-            for i, line in enumerate(f):
-                # Ajouter une virgule après chaque terme sauf pour le dernier du fichier
-                term = line.strip()
-                if i < total_lines - 1:  # Si ce n'est pas la dernière ligne du fichier entier
-                    term = term + ','
-                lines.append(term)
-                
-                if (i + 1) % chunk_size == 0:
-                    # Écrire le chunk actuel
-                    last_idx = (i + 1) // chunk_size
-                    last_file = final_dir / f"chunk_{last_idx:03d}.txt"
-                    
-                    # Si c'est le dernier chunk et que c'est aussi le dernier fichier, on retire la virgule du dernier terme
-                    if (i + 1) == total_lines and lines:
-                        lines[-1] = lines[-1].rstrip(',')
+        # Lire le fichier dédupliqué par gros blocs d'octets et écrire chaque morceau directement dans
+        # son chunk : les écritures partent, dans l'ordre, vers un thread d'écriture pendant que le bloc
+        # suivant est préparé. Au plus SPLIT_MAX_PENDING écritures restent en attente, la mémoire utilisée
+        # ne dépend donc pas de la taille des chunks. Les messages suivent l'ordre des fichiers.
+        last_idx = 0
+        count = 0
+        out: Optional[BinaryIO] = None
+        pending: Deque[Tuple['Future[Any]', Optional[Path], int]] = deque()
+        
+        def submit(fn: Callable[..., Any], *args: Any, done: Optional[Path] = None, line_count: int = 0) -> None:
+            pending.append((writer.submit(fn, *args), done, line_count))
+            if len(pending) > SPLIT_MAX_PENDING:
+                self._finish_split_write(*pending.popleft())
+        
+        try:
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                blocks = _iter_clean_blocks(self.deduped_path)
+                block = next(blocks, None)
+                while block is not None:
+                    # Anticipation d'un bloc : seul le dernier terme du fichier n'a pas de virgule finale
+                    next_block = next(blocks, None)
+                    remaining = block.count(b'\n')
+                    block = block.replace(b'\n', b',\n')
+                    if next_block is None:
+                        block = block[:-2].rstrip(b',') + b'\n'
+                    view = memoryview(block)
                     
-                    # Utiliser open() au lieu de write_text() pour avoir plus de contrôle sur les erreurs d'encodage
-                    with open(last_file, "w", encoding="utf-8", errors="replace") as f:
-                        f.write("\n".join(lines) + "\n")
-                    self.console.print(f"[green]Fichier {last_file.name} créé avec {len(lines):,} lignes.[/green]")
-                    lines = []
-            
-            # Écrire le dernier chunk s'il reste des lignes
-            if lines:
-                last_idx += 1
-                last_file = final_dir / f"chunk_{last_idx:03d}.txt"
+                    start = 0
+                    while remaining:
+                        if out is None:
+                            last_idx += 1
+                            path = final_dir / f"chunk_{last_idx:03d}.txt"
+                            out = open(path, "wb")
+                        room = chunk_size - count
+                        if remaining <= room:
+                            submit(out.write, view[start:] if start else view)
+                            count += remaining
+                            remaining = 0
+                        else:
+                            end = _nth_line_end(block, room, start)
+                            submit(out.write, view[start:end])
+                            count += room
+                            remaining -= room
+                            start = end
+                        if count == chunk_size:
+                            submit(out.close, done=path, line_count=count)
+                            out = None
+                            count = 0
+                    block = next_block
                 
-                # S'assurer que le dernier terme du dernier fichier n'a pas de virgule
-                if lines:  # cette vérification est redondante mais préserve la logique d'origine
-                    lines[-1] = lines[-1].rstrip(',')
+                # Fermer le dernier chunk s'il reste des lignes
+                if out is not None:
+                    submit(out.close, done=path, line_count=count)
+                    out = None
                 
-                # Utiliser open() au lieu de write_text() pour avoir plus de contrôle sur les erreurs d'encodage
-                with open(str(last_file), "w", encoding="utf-8", errors="replace") as f:
-                    f.write("\n".join(lines) + "\n")
-                self.console.print(f"[green]Fichier {last_file.name} créé avec {len(lines):,} lignes.[/green]")
+                # Attendre les écritures restantes
+                while pending:
+                    self._finish_split_write(*pending.popleft())
+        finally:
+            # En cas d'erreur, les écritures en attente sont terminées à la sortie du pool
+            if out is not None:
+                out.close()
         
         self.console.print(f"[green]✓ Split des données dédupliquées terminé: {last_idx} fichiers créés.[/green]")
 
+    def _finish_split_write(self, future: 'Future[Any]', path: Optional[Path], line_count: int) -> None:
+        """
+        Attend une écriture du pool (et propage son éventuelle erreur) ; annonce le chunk
+        lorsqu'il s'agit de sa fermeture.
+        
+        Args:
+            future: Écriture ou fermeture en cours dans le pool
+            path: Fichier de sortie si le chunk vient d'être fermé, sinon None
+            line_count: Nombre de lignes du chunk
+        """
+        future.result()
+        if path is not None:
+            self.console.print(f"[green]Fichier {path.name} créé avec {line_count:,} lignes.[/green]")
@@ -1,143 +1,129 @@
 """
 Module de traduction pour l'interface interactive.
-Contient les traductions des textes de l'interface.
+Contient les traductions des textes de l'interface : le français est défini ici,
+les autres langues sont chargées depuis leur propre module à leur premier usage.
 """
 
-TRANSLATIONS = {
-    "fr": {
-        # Messages généraux
-        "startup_message": "[bold green]Démarrage de l'interface interactive d'aggregator Nickname...[/bold green]",
-        "goodbye_message": "[bold green]Au revoir ![/bold green]",
-        "invalid_choice": "[bold red]Choix invalide. Veuillez réessayer.[/bold red]",
-        
-        # Titre du menu
-        "menu_title": "[bold cyan]Menu Interactif aggregator Nickname[/bold cyan]\n\n",
-        "auto_menu_title": "[bold green]Menu automatique :[/bold green]\n",
-        "auto_option_1": "1. Exporter tout (pseudonymes, emails, mots de passe)",
-        "auto_option_2": "2. Exporter uniquement les pseudonymes",
-        "auto_option_3": "3. Exporter uniquement les emails",
-        "auto_option_4": "4. Exporter uniquement les mots de passe",
-        "auto_option_0": "0. Quitter\n",
-        "manual_menu_title": "[bold cyan]Menu manuel :[/bold cyan]\n",
-        "manual_option_5": "5. Télécharger tout",
-        "manual_option_6": "6. Exporter tout",
-        "manual_option_7": "7. Split / déduplication",
-        "manual_option_8": "8. Exporter uniquement les pseudonymes",
-        "manual_option_9": "9. Exporter uniquement les emails",
-        "manual_option_10": "10. Exporter uniquement les mots de passe",
-        "manual_option_11": "11. Nettoyer entièrement le projet (suppression TOTALE)",
-        "manual_option_12": "12. Afficher les statistiques",
-        "manual_option_0": "0. Quitter",
-        "panel_title": "[bold]aggregator Nickname[/bold]",
-        
-        # Options du menu
-        "menu_item_1": "1. Télécharger les sources",
-        "menu_item_2": "2. Normaliser les données",
-        "menu_item_3": "3. Créer des chunks depuis les données normalisées",
-        "menu_item_4": "4. Dédupliquer les chunks",
-        "menu_item_5": "5. Exporter les données",
-        "menu_item_6": "6. Diviser le fichier dédupliqué",
-        "menu_item_7": "7. [bold yellow]Diviser le fichier dédupliqué en mode test[/bold yellow]",
-        "menu_item_8": "8. [bold red]Nettoyage strict (whitelist)[/bold red]",
-        "menu_item_9": "9. Vider le dossier final",
-        "menu_item_10": "10. Vider le dossier raw",
-        "menu_item_11": "11. Vider le cache normalisé",
-        "menu_item_12": "12. Vider les fichiers temporaires",
-        "menu_item_13": "13. [bold green]Lancer le programme en mode automatique complet[/bold green]",
-        "menu_item_14": "14. [bold cyan]Lancer le programme en mode automatique avec choix du nombre de lignes par fichier[/bold cyan]",
-        "menu_item_15": "15. [bold magenta]Afficher les statistiques[/bold magenta]",
-        "menu_item_16": "16. [bold blue]Exporter séparément les emails et pseudonymes[/bold blue]",
-        "menu_item_0": "0. Quitter",
-        
-        # Entrée utilisateur
-        "enter_choice": "Entrez votre choix (0-16): ",
-        "confirm_strict_clean": "[bold red]ATTENTION: Cette opération va supprimer tous les fichiers non essentiels du projet. Confirmer? (oui/non): [/bold red]",
-        "enter_lines_per_file": "Entrez le nombre de lignes par fichier (appuyez sur Entrée pour 1 000 000) : ",
-        "modify_lines_per_file": "Souhaitez-vous modifier ce nombre de lignes par fichier ? (Entrez un nombre ou appuyez sur Entrée pour conserver la valeur par défaut) : ",
-        
-        # Statistiques
-        "stats_title": "Statistiques aggregator Nickname",
-        "stats_column_1": "Métrique",
-        "stats_column_2": "Valeur",
-        "stats_row_1": "Sources téléchargées",
-        "stats_row_2": "Entrées brutes",
-        "stats_row_3": "Entrées normalisées",
-        "stats_row_4": "Entrées dédupliquées",
-        
-        # Erreurs
-        "errors_title": "Erreurs rencontrées pendant l'exécution",
-        "errors_column_phase": "Phase",
-        "errors_column_type": "Type",
-        "errors_column_message": "Message",
-        "errors_column_time": "Heure",
-        "no_errors": "Aucune erreur rencontrée pendant l'exécution",
-        "welcome_title": "Bienvenue dans aggregator Nickname!"
-    },
-    "en": {
-        # Messages généraux
-        "startup_message": "[bold green]Starting aggregator Nickname interactive interface...[/bold green]",
-        "goodbye_message": "[bold green]Goodbye![/bold green]",
-        "invalid_choice": "[bold red]Invalid choice. Please try again.[/bold red]",
-        
-        # Titre du menu
-        "menu_title": "[bold cyan]aggregator Nickname Interactive Menu[/bold cyan]\n\n",
-        "auto_menu_title": "[bold green]Automatic menu:[/bold green]\n",
-        "auto_option_1": "1. Export all (nicknames, emails, passwords)",
-        "auto_option_2": "2. Export only nicknames",
-        "auto_option_3": "3. Export only emails",
-        "auto_option_4": "4. Export only passwords",
-        "auto_option_0": "0. Exit\n",
-        "manual_menu_title": "[bold cyan]Manual menu:[/bold cyan]\n",
-        "manual_option_5": "5. Download all",
-        "manual_option_6": "6. Export all",
-        "manual_option_7": "7. Split / deduplication",
-        "manual_option_8": "8. Export only nicknames",
-        "manual_option_9": "9. Export only emails",
-        "manual_option_10": "10. Export only passwords",
-        "manual_option_11": "11. Clear entire project (FULL removal)",
-        "manual_option_12": "12. Show statistics",
-        "manual_option_0": "0. Exit",
-        "panel_title": "[bold]aggregator Nickname[/bold]",
-        
-        # Options du menu
-        "menu_item_1": "1. Download sources",
-        "menu_item_2": "2. Normalize data",
-        "menu_item_3": "3. Create chunks from normalized data",
-        "menu_item_4": "4. Deduplicate chunks",
-        "menu_item_5": "5. Export data",
-        "menu_item_6": "6. Split deduplicated file",
-        "menu_item_7": "7. [bold yellow]Split deduplicated file in test mode[/bold yellow]",
-        "menu_item_8": "8. [bold red]Strict cleaning (whitelist)[/bold red]",
-        "menu_item_9": "9. Clear final folder",
-        "menu_item_10": "10. Clear raw folder",
-        "menu_item_11": "11. Clear normalized cache",
-        "menu_item_12": "12. Clear temporary files",
-        "menu_item_13": "13. [bold green]Run program in complete automatic mode[/bold green]",
-        "menu_item_14": "14. [bold cyan]Run program in automatic mode with custom lines per file[/bold cyan]",
-        "menu_item_15": "15. [bold magenta]Show statistics[/bold magenta]",
-        "menu_item_16": "16. [bold blue]Export emails and nicknames separately[/bold blue]",
-        "menu_item_0": "0. Exit",
-        
-        # Entrée utilisateur
-        "enter_choice": "Enter your choice (0-16): ",
-        "confirm_strict_clean": "[bold red]WARNING: This operation will delete all non-essential files from the project. Confirm? (yes/no): [/bold red]",
-        "enter_lines_per_file": "Enter the number of lines per file (press Enter for 1,000,000): ",
-        "modify_lines_per_file": "Would you like to modify the number of lines per file? (Enter a number or press Enter to keep the default value): ",
-        
-        # Statistiques
-        "stats_title": "aggregator Nickname Statistics",
-        "stats_column_1": "Metric",
-        "stats_column_2": "Value",
-        "stats_row_1": "Downloaded sources",
-        "stats_row_2": "Raw entries",
-        "stats_row_3": "Normalized entries",
-        "stats_row_4": "Deduplicated entries"
-    }
+from enum import IntEnum
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import Callable, Dict, Final, Mapping, Tuple
+
+from rich.text import Text
+
+# Traductions françaises : langue par défaut et de repli, toujours chargée
+_FR: Final[Dict[str, str]] = {
+    # Messages généraux
+    "startup_message": "[bold green]Démarrage de l'interface interactive d'aggregator Nickname...[/bold green]",
+    "goodbye_message": "[bold green]Au revoir ![/bold green]",
+    "invalid_choice": "[bold red]Choix invalide. Veuillez réessayer.[/bold red]",
+    
+    # Titre du menu
+    "menu_title": "[bold cyan]Menu Interactif aggregator Nickname[/bold cyan]\n\n",
+    "auto_menu_title": "[bold green]Menu automatique :[/bold green]\n",
+    "auto_option_1": "1. Exporter tout (pseudonymes, emails, mots de passe)",
+    "auto_option_2": "2. Exporter uniquement les pseudonymes",
+    "auto_option_3": "3. Exporter uniquement les emails",
+    "auto_option_4": "4. Exporter uniquement les mots de passe",
+    "auto_option_0": "0. Quitter\n",
+    "manual_menu_title": "[bold cyan]Menu manuel :[/bold cyan]\n",
+    "manual_option_5": "5. Télécharger tout",
+    "manual_option_6": "6. Exporter tout",
+    "manual_option_7": "7. Split / déduplication",
+    "manual_option_8": "8. Exporter uniquement les pseudonymes",
+    "manual_option_9": "9. Exporter uniquement les emails",
+    "manual_option_10": "10. Exporter uniquement les mots de passe",
+    "manual_option_11": "11. Nettoyer entièrement le projet (suppression TOTALE)",
+    "manual_option_12": "12. Afficher les statistiques",
+    "manual_option_0": "0. Quitter",
+    "panel_title": "[bold]aggregator Nickname[/bold]",
+    
+    # Options du menu
+    "menu_item_1": "1. Télécharger les sources",
+    "menu_item_2": "2. Normaliser les données",
+    "menu_item_3": "3. Créer des chunks depuis les données normalisées",
+    "menu_item_4": "4. Dédupliquer les chunks",
+    "menu_item_5": "5. Exporter les données",
+    "menu_item_6": "6. Diviser le fichier dédupliqué",
+    "menu_item_7": "7. [bold yellow]Diviser le fichier dédupliqué en mode test[/bold yellow]",
+    "menu_item_8": "8. [bold red]Nettoyage strict (whitelist)[/bold red]",
+    "menu_item_9": "9. Vider le dossier final",
+    "menu_item_10": "10. Vider le dossier raw",
+    "menu_item_11": "11. Vider le cache normalisé",
+    "menu_item_12": "12. Vider les fichiers temporaires",
+    "menu_item_13": "13. [bold green]Lancer le programme en mode automatique complet[/bold green]",
+    "menu_item_14": "14. [bold cyan]Lancer le programme en mode automatique avec choix du nombre de lignes par fichier[/bold cyan]",
+    "menu_item_15": "15. [bold magenta]Afficher les statistiques[/bold magenta]",
+    "menu_item_16": "16. [bold blue]Exporter séparément les emails et pseudonymes[/bold blue]",
+    "menu_item_0": "0. Quitter",
+    
+    # Entrée utilisateur
+    "enter_choice": "Entrez votre choix (0-16): ",
+    "confirm_strict_clean": "[bold red]ATTENTION: Cette opération va supprimer tous les fichiers non essentiels du projet. Confirmer? (oui/non): [/bold red]",
+    "enter_lines_per_file": "Entrez le nombre de lignes par fichier (appuyez sur Entrée pour 1 000 000) : ",
+    "modify_lines_per_file": "Souhaitez-vous modifier ce nombre de lignes par fichier ? (Entrez un nombre ou appuyez sur Entrée pour conserver la valeur par défaut) : ",
+    
+    # Statistiques
+    "stats_title": "Statistiques aggregator Nickname",
+    "stats_column_1": "Métrique",
+    "stats_column_2": "Valeur",
+    "stats_row_1": "Sources téléchargées",
+    "stats_row_2": "Entrées brutes",
+    "stats_row_3": "Entrées normalisées",
+    "stats_row_4": "Entrées dédupliquées",
+    
+    # Erreurs
+    "errors_title": "Erreurs rencontrées pendant l'exécution",
+    "errors_column_phase": "Phase",
+    "errors_column_type": "Type",
+    "errors_column_message": "Message",
+    "errors_column_time": "Heure",
+    "no_errors": "Aucune erreur rencontrée pendant l'exécution",
+    "welcome_title": "Bienvenue dans aggregator Nickname!"
 }
 
+# Chargeurs des langues disponibles ; seul le module de la langue demandée est importé
+_LOADERS: Final[Mapping[str, Callable[[], Dict[str, str]]]] = MappingProxyType({
+    "fr": lambda: _FR,
+    "en": lambda: import_module(".translations_en", __package__).TEXTS,
+})
+
+
+@cache
+def _language(lang: str) -> Mapping[str, str]:
+    """
+    Charge les textes d'une langue au premier usage, en lecture seule.
+    
+    Args:
+        lang: Code de langue (fr ou en), French par défaut si inconnu
+        
+    Returns:
+        Mapping[str, str]: Textes de la langue, indexés par clé
+    """
+    loader = _LOADERS.get(lang)
+    if loader is None:
+        return _language("fr")  # Fallback to French
+    return MappingProxyType(loader())
+
+# Identifiant entier de chaque message (ordre des clés françaises) : la traduction
+# devient un simple accès par indice dans le tuple de textes de la langue
+MsgId = IntEnum("MsgId", [(key, index) for index, key in enumerate(_FR)])
+
+# Options des menus automatique et manuel, dans l'ordre d'affichage
+_AUTO_MENU_KEYS: Final = ("auto_option_1", "auto_option_2", "auto_option_3", "auto_option_4", "auto_option_0")
+_MANUAL_MENU_KEYS: Final = (
+    "manual_option_5", "manual_option_7", "manual_option_6", "manual_option_8",
+    "manual_option_9", "manual_option_10", "manual_option_11", "manual_option_12",
+    "manual_option_0",
+)
+
+
+@cache
 def get_translation(key: str, lang: str = "fr") -> str:
     """
     Récupère la traduction d'une clé dans la langue spécifiée.
+    Les résultats sont mis en cache sans limite : les textes sont en lecture seule et le jeu de clés est fixe.
     
     Args:
         key: Clé de traduction
@@ -146,11 +132,65 @@ def get_translation(key: str, lang: str = "fr") -> str:
     Returns:
         str: Texte traduit
     """
-    if lang not in TRANSLATIONS:
-        lang = "fr"  # Fallback to French
+    # Si la clé n'existe pas, retourner la clé elle-même
+    return _language(lang).get(key, key)
+
+
+@cache
+def get_rich(key: str, lang: str = "fr") -> Text:
+    """
+    Récupère la traduction d'une clé déjà convertie en rich.text.Text : le balisage Rich
+    n'est analysé qu'une fois, console.print n'a plus à le relire à chaque affichage.
+    Le Text retourné est partagé et ne doit pas être modifié.
+    
+    Args:
+        key: Clé de traduction
+        lang: Code de langue (fr ou en)
         
-    if key not in TRANSLATIONS[lang]:
-        # Si la clé n'existe pas, retourner la clé elle-même
-        return key
+    Returns:
+        Text: Texte traduit, balisage appliqué
+    """
+    return Text.from_markup(get_translation(key, lang))
+
+
+@cache
+def _rendered(lang: str) -> Mapping[str, str]:
+    """Textes complets des menus d'une langue, assemblés au premier usage."""
+    texts = _language(lang)
+    return MappingProxyType({
+        "auto_menu": texts.get("auto_menu_title", "auto_menu_title")
+                     + "\n".join(texts.get(key, key) for key in _AUTO_MENU_KEYS),
+        "manual_menu": texts.get("manual_menu_title", "manual_menu_title")
+                       + "\n".join(texts.get(key, key) for key in _MANUAL_MENU_KEYS),
+    })
+
+
+def get_rendered(name: str, lang: str = "fr") -> str:
+    """
+    Récupère un texte de menu pré-assemblé dans la langue spécifiée.
+    
+    Args:
+        name: Nom du bloc ("auto_menu" ou "manual_menu")
+        lang: Code de langue (fr ou en), French par défaut si inconnu
         
-    return TRANSLATIONS[lang][key]
+    Returns:
+        str: Texte complet du menu
+    """
+    return _rendered(lang)[name]
+
+
+@cache
+def message_table(lang: str = "fr") -> Tuple[str, ...]:
+    """
+    Retourne les textes d'une langue indexés par MsgId (table[MsgId.startup_message]).
+    Le résultat est un tuple de type stable : l'accès par indice est spécialisé par l'interpréteur.
+    Un message absent de la langue est remplacé par sa clé, comme avec get_translation.
+    
+    Args:
+        lang: Code de langue (fr ou en), French par défaut si inconnu
+        
+    Returns:
+        Tuple[str, ...]: Textes traduits, dans l'ordre de MsgId
+    """
+    texts = _language(lang)
+    return tuple(texts.get(msg.name, msg.name) for msg in MsgId)
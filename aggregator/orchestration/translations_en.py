@@ -0,0 +1,67 @@
+"""
+Traductions anglaises de l'interface interactive.
+Chargées à la demande par translations.py, uniquement si la langue anglaise est utilisée.
+"""
+
+from typing import Dict, Final
+
+TEXTS: Final[Dict[str, str]] = {
+    # Messages généraux
+    "startup_message": "[bold green]Starting aggregator Nickname interactive interface...[/bold green]",
+    "goodbye_message": "[bold green]Goodbye![/bold green]",
+    "invalid_choice": "[bold red]Invalid choice. Please try again.[/bold red]",
+    
+    # Titre du menu
+    "menu_title": "[bold cyan]aggregator Nickname Interactive Menu[/bold cyan]\n\n",
+    "auto_menu_title": "[bold green]Automatic menu:[/bold green]\n",
+    "auto_option_1": "1. Export all (nicknames, emails, passwords)",
+    "auto_option_2": "2. Export only nicknames",
+    "auto_option_3": "3. Export only emails",
+    "auto_option_4": "4. Export only passwords",
+    "auto_option_0": "0. Exit\n",
+    "manual_menu_title": "[bold cyan]Manual menu:[/bold cyan]\n",
+    "manual_option_5": "5. Download all",
+    "manual_option_6": "6. Export all",
+    "manual_option_7": "7. Split / deduplication",
+    "manual_option_8": "8. Export only nicknames",
+    "manual_option_9": "9. Export only emails",
+    "manual_option_10": "10. Export only passwords",
+    "manual_option_11": "11. Clear entire project (FULL removal)",
+    "manual_option_12": "12. Show statistics",
+    "manual_option_0": "0. Exit",
+    "panel_title": "[bold]aggregator Nickname[/bold]",
+    
+    # Options du menu
+    "menu_item_1": "1. Download sources",
+    "menu_item_2": "2. Normalize data",
+    "menu_item_3": "3. Create chunks from normalized data",
+    "menu_item_4": "4. Deduplicate chunks",
+    "menu_item_5": "5. Export data",
+    "menu_item_6": "6. Split deduplicated file",
+    "menu_item_7": "7. [bold yellow]Split deduplicated file in test mode[/bold yellow]",
+    "menu_item_8": "8. [bold red]Strict cleaning (whitelist)[/bold red]",
+    "menu_item_9": "9. Clear final folder",
+    "menu_item_10": "10. Clear raw folder",
+    "menu_item_11": "11. Clear normalized cache",
+    "menu_item_12": "12. Clear temporary files",
+    "menu_item_13": "13. [bold green]Run program in complete automatic mode[/bold green]",
+    "menu_item_14": "14. [bold cyan]Run program in automatic mode with custom lines per file[/bold cyan]",
+    "menu_item_15": "15. [bold magenta]Show statistics[/bold magenta]",
+    "menu_item_16": "16. [bold blue]Export emails and nicknames separately[/bold blue]",
+    "menu_item_0": "0. Exit",
+    
+    # Entrée utilisateur
+    "enter_choice": "Enter your choice (0-16): ",
+    "confirm_strict_clean": "[bold red]WARNING: This operation will delete all non-essential files from the project. Confirm? (yes/no): [/bold red]",
+    "enter_lines_per_file": "Enter the number of lines per file (press Enter for 1,000,000): ",
+    "modify_lines_per_file": "Would you like to modify the number of lines per file? (Enter a number or press Enter to keep the default value): ",
+    
+    # Statistiques
+    "stats_title": "aggregator Nickname Statistics",
+    "stats_column_1": "Metric",
+    "stats_column_2": "Value",
+    "stats_row_1": "Downloaded sources",
+    "stats_row_2": "Raw entries",
+    "stats_row_3": "Normalized entries",
+    "stats_row_4": "Deduplicated entries"
+}
@@ -6,9 +6,12 @@ Contient des fonctions utilitaires communes utilisées par différents modules.
 import asyncio
 import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from contextlib import ExitStack
+from typing import IO, Iterator, List, Dict, Optional, TextIO, Tuple
 from rich.console import Console
+from rich.table import Table
 from datetime import datetime
 
 # Import des décorateurs de gestion d'erreurs
@@ -17,11 +20,183 @@ from .error_handling import log_errors, capture_errors
 # Imports nécessaires pour les définitions de types
 from ..config import Config, Source, load_config
 
-from ..download import download_source_data, is_binary_file, validate_downloaded_files
+from ..download import BINARY_EXTENSIONS, download_source_data, is_binary_file, validate_downloaded_files
 from ..export import export_data
 from ..dedupe import deduplicate_chunks
 
 
+# Résultats de is_binary_file, indexés par (chemin, mtime en ns, taille) du fichier
+_IS_BINARY_CACHE: Dict[Tuple[str, int, int], bool] = {}
+
+# Taille des lectures binaires lors du comptage des lignes
+COUNT_READ_SIZE = 1024 * 1024
+
+# Nombre maximal de fichiers copiés simultanément lors de la copie d'un dossier source
+COPYTREE_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Taille des tampons de lecture/écriture des exports
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+
+def _count_lines_fast(path: Path) -> int:
+    """
+    Compte les lignes d'un fichier en comptant les \n de blocs binaires (bytes.count, sans décodage).
+    Une dernière ligne sans \n final est comptée, comme lors d'une itération en mode texte.
+    
+    Args:
+        path: Fichier à compter
+        
+    Returns:
+        int: Nombre de lignes
+    """
+    total = 0
+    last = b'\n'
+    with open(path, "rb") as f:
+        while True:
+            buf = f.read(COUNT_READ_SIZE)
+            if not buf:
+                break
+            total += buf.count(b'\n')
+            last = buf[-1:]
+    return total if last == b'\n' else total + 1
+
+
+def _is_binary_cached(path: Path, st: Optional[os.stat_result] = None) -> bool:
+    """
+    is_binary_file mémorisé tant que le fichier n'a pas changé (même mtime et même taille).
+    
+    Args:
+        path: Chemin du fichier à tester
+        st: Résultat de stat déjà connu (par exemple via DirEntry.stat()), pour éviter un appel système
+        
+    Returns:
+        bool: True si le fichier est binaire, False s'il est texte
+    """
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return is_binary_file(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    result = _IS_BINARY_CACHE.get(key)
+    if result is None:
+        result = _IS_BINARY_CACHE[key] = is_binary_file(path)
+    return result
+
+
+def _advise_sequential(f: IO) -> None:
+    """
+    Indique au noyau qu'un fichier sera lu séquentiellement, pour qu'il agrandisse sa lecture anticipée.
+    Sans effet sur les plateformes sans posix_fadvise.
+    
+    Args:
+        f: Fichier ouvert en lecture
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _copy_and_count(src: Path, dst: Path) -> int:
+    """
+    Copie un fichier texte en comptant ses lignes au passage, en une seule lecture de la source.
+    Seul le contenu est copié : le fichier normalisé est un artefact dérivé, ses métadonnées importent peu.
+    
+    Args:
+        src: Fichier source
+        dst: Fichier de destination
+        
+    Returns:
+        int: Nombre de lignes (même convention que _count_lines_fast)
+    """
+    total = 0
+    last = b'\n'
+    with open(src, "rb") as fi, open(dst, "wb") as fo:
+        while True:
+            buf = fi.read(COUNT_READ_SIZE)
+            if not buf:
+                break
+            fo.write(buf)
+            total += buf.count(b'\n')
+            last = buf[-1:]
+    return total if last == b'\n' else total + 1
+
+
+def _copytree_parallel(src: Path, dst: Path) -> None:
+    """
+    Copie un dossier comme shutil.copytree, mais en copiant les fichiers en parallèle dans un pool de threads.
+    copytree crée les dossiers dans l'ordre du parcours ; seules les copies de fichiers sont déléguées au pool.
+    
+    Args:
+        src: Dossier source
+        dst: Dossier de destination (ne doit pas exister)
+    """
+    futures: List[Future] = []
+    with ThreadPoolExecutor(max_workers=COPYTREE_MAX_WORKERS) as pool:
+        def submit_copy(s: str, d: str) -> None:
+            futures.append(pool.submit(shutil.copyfile, s, d))
+        
+        shutil.copytree(src, dst, copy_function=submit_copy)
+        for future in futures:
+            future.result()
+
+
+def _walk_scandir(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Parcourt récursivement un dossier avec os.scandir et renvoie ses fichiers réguliers.
+    Les DirEntry mettent en cache leur type et leur stat, ce qui évite un appel système par vérification.
+    
+    Args:
+        root: Dossier à parcourir
+        
+    Returns:
+        Iterator[os.DirEntry]: Fichiers trouvés
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _summarize_dir(root: Path) -> Tuple[int, int, int, List[Tuple[str, Exception]]]:
+    """
+    Compte les fichiers, la taille totale et les lignes des fichiers texte d'un dossier.
+    Les fichiers dont l'extension est connue comme binaire ne sont pas ouverts.
+    
+    Args:
+        root: Dossier à analyser
+        
+    Returns:
+        Tuple (nombre de fichiers, taille totale en octets, lignes texte, erreurs de comptage)
+    """
+    total_files = 0
+    total_size = 0
+    text_lines = 0
+    errors = []
+    for entry in _walk_scandir(root):
+        st = entry.stat()
+        total_files += 1
+        total_size += st.st_size
+        
+        # Si c'est un fichier texte, compter les lignes pour les statistiques
+        if os.path.splitext(entry.name)[1].lower() in BINARY_EXTENSIONS:
+            continue
+        file_path = Path(entry.path)
+        if _is_binary_cached(file_path, st):
+            continue
+        try:
+            text_lines += _count_lines_fast(file_path)
+        except Exception as e:
+            errors.append((entry.path, e))
+    return total_files, total_size, text_lines, errors
+
+
 class UtilsMixin:
     """Mixin pour les fonctionnalités utilitaires de l'orchestrateur."""
     
@@ -43,6 +218,8 @@ class UtilsMixin:
         Recharge la configuration depuis le fichier config_path.
         Cette méthode est utile après un nettoyage du projet pour s'assurer
         que la configuration est correctement chargée.
+        Le fichier n'est relu que s'il a changé (date de modification ou taille) depuis le dernier chargement
+        (cache de load_config).
         """
         try:
             self.console.print("[cyan]Rechargement de la configuration...[/cyan]")
@@ -57,20 +234,22 @@ class UtilsMixin:
         """
         Télécharge les sources définies dans la configuration.
         """
-        self.console.print("!!!!!!!!!!!!!!!!!!!!!!!!!!!! DEBUG UTILS: ENTRÉE DANS UtilsMixin.run_download_sources !!!!!!!!!!!!!!!!!!!!!!!!!!!!") # Corrected Indentation, using self.console.print
         self.console.print("\n[bold blue]Téléchargement des sources...[/bold blue]")
-        self.console.print(f"[bold yellow]DEBUG UTILS: self.config type: {type(self.config)}[/bold yellow]")
-        if self.config: # Check if config is not None first
-            if hasattr(self.config, 'sources'):
-                self.console.print(f"[bold yellow]DEBUG UTILS: Nombre de sources trouvées dans config: {len(self.config.sources)}[/bold yellow]")
-                if self.config.sources: # Check if sources list is not empty
-                    self.console.print(f"[bold yellow]DEBUG UTILS: Première source: {self.config.sources[0].slug}[/bold yellow]")
+        
+        # Diagnostics de configuration uniquement sur demande, comme pour le menu interactif
+        if os.environ.get("AGGREGATOR_DEBUG_UTILS"):
+            self.console.print(f"[bold yellow]DEBUG UTILS: self.config type: {type(self.config)}[/bold yellow]")
+            if self.config: # Check if config is not None first
+                if hasattr(self.config, 'sources'):
+                    self.console.print(f"[bold yellow]DEBUG UTILS: Nombre de sources trouvées dans config: {len(self.config.sources)}[/bold yellow]")
+                    if self.config.sources: # Check if sources list is not empty
+                        self.console.print(f"[bold yellow]DEBUG UTILS: Première source: {self.config.sources[0].slug}[/bold yellow]")
+                    else:
+                        self.console.print(f"[bold red]DEBUG UTILS: self.config.sources EST VIDE ![/bold red]")
                 else:
-                    self.console.print(f"[bold red]DEBUG UTILS: self.config.sources EST VIDE ![/bold red]")
+                    self.console.print(f"[bold red]DEBUG UTILS: self.config N'A PAS D'ATTRIBUT 'sources' ![/bold red]")
             else:
-                self.console.print(f"[bold red]DEBUG UTILS: self.config N'A PAS D'ATTRIBUT 'sources' ![/bold red]")
-        else:
-            self.console.print(f"[bold red]DEBUG UTILS: self.config EST NONE ![/bold red]")
+                self.console.print(f"[bold red]DEBUG UTILS: self.config EST NONE ![/bold red]")
         
         # Vérifier si la configuration est correctement chargée, sinon la recharger
         if not self.config or not hasattr(self.config, 'sources') or not self.config.sources:
@@ -82,43 +261,62 @@ class UtilsMixin:
         # Créer le répertoire raw s'il n'existe pas
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         
-        # Télécharger chaque source
-        for source in self.config.sources:
-            self.console.print(f"[cyan]Téléchargement de {source.slug}...[/cyan]")
-            try:
+        # Télécharger les sources en parallèle, avec un nombre limité de téléchargements simultanés
+        semaphore = asyncio.Semaphore(max(1, self.config.defaults.max_concurrent_downloads))
+        results = await asyncio.gather(*(self._download_one(source, semaphore) for source in self.config.sources))
+        
+        # Enregistrer les chemins dans l'ordre de la configuration (ordre de priorité des sources)
+        for source, paths in zip(self.config.sources, results, strict=True):
+            if paths:
+                self.source_paths[source.slug] = paths
+                
+        self.console.print(f"[bold green]✓ Téléchargement terminé. {self.stats['sources_downloaded']} sources téléchargées.[/bold green]")
+    
+    async def _download_one(self, source: Source, semaphore: asyncio.Semaphore) -> Optional[List[Path]]:
+        """
+        Télécharge une source puis compte ses entrées brutes.
+        
+        Args:
+            source: Source à télécharger
+            semaphore: Sémaphore limitant le nombre de téléchargements simultanés
+            
+        Returns:
+            Optional[List[Path]]: Fichiers téléchargés, ou None en cas d'échec
+        """
+        try:
+            async with semaphore:
+                self.console.print(f"[cyan]Téléchargement de {source.slug}...[/cyan]")
                 paths = await download_source_data(
                     source,
                     self.raw_dir,
                     self.console
                 )
+            
+            if paths:
+                self.stats['sources_downloaded'] += 1
                 
-                if paths:
-                    self.source_paths[source.slug] = paths
-                    self.stats['sources_downloaded'] += 1
-                    
-                    # Compter les entrées brutes
-                    for path in paths:
-                        if path.exists() and path.is_file():
-                            try:
-                                # Vérifier s'il s'agit d'un fichier texte avant d'essayer de le lire
-                                # Liste des extensions de fichiers binaires à ignorer
-                                binary_extensions = ['.zip', '.rar', '.gz', '.tar', '.7z', '.exe', '.bin', '.dat', '.pdf', '.png', '.jpg', '.jpeg', '.gif']
+                # Compter les entrées brutes ; le détail par fichier est affiché en un seul tableau
+                file_stats = []
+                for path in paths:
+                    if path.exists() and path.is_file():
+                        try:
+                            # Vérifier s'il s'agit d'un fichier texte avant d'essayer de le lire
+                            # Ignorer les fichiers binaires
+                            if path.suffix.lower() in BINARY_EXTENSIONS:
+                                file_stats.append((path.name, "[yellow]binaire, ignoré pour le comptage[/yellow]"))
+                                continue
                                 
-                                # Ignorer les fichiers binaires
-                                if any(str(path).lower().endswith(ext) for ext in binary_extensions):
-                                    self.console.print(f"[yellow]Fichier binaire ignoré pour le comptage: {path}[/yellow]")
-                                    continue
-                                    
-                                # Essayer de lire le fichier comme texte
-                                count = sum(1 for _ in open(path, "r", encoding="utf-8", errors="ignore"))
-                                self.stats['entries_raw'] += count
-                                self.console.print(f"[green]Fichier {path.name} : {count} entrées brutes[/green]")
-                            except Exception as e:
-                                self.console.print(f"[red]Erreur lors du comptage des entrées dans {path}: {e}[/red]")
-            except Exception as e:
-                self.console.print(f"[bold red]Erreur lors du téléchargement de {source.slug}: {e}[/bold red]")
-                
-        self.console.print(f"[bold green]✓ Téléchargement terminé. {self.stats['sources_downloaded']} sources téléchargées.[/bold green]")
+                            # Compter les lignes hors de la boucle d'événements
+                            count = await asyncio.to_thread(_count_lines_fast, path)
+                            self.stats['entries_raw'] += count
+                            file_stats.append((path.name, f"[green]{count} entrées brutes[/green]"))
+                        except Exception as e:
+                            self.console.print(f"[red]Erreur lors du comptage des entrées dans {path}: {e}[/red]")
+                self._print_file_stats(source.slug, file_stats)
+            return paths
+        except Exception as e:
+            self.console.print(f"[bold red]Erreur lors du téléchargement de {source.slug}: {e}[/bold red]")
+            return None
     
     @log_errors("Normalisation des données")
     async def run_normalize(self):
@@ -138,14 +336,16 @@ class UtilsMixin:
         normalized_count = 0
         normalized_files = {}
         
-        # Valider tous les chemins avant traitement
+        # Valider tous les chemins avant traitement, en notant à quelle(s) source(s) appartient chacun
         all_paths = []
+        path_to_slugs: Dict[Path, List[str]] = {}
         for source_slug, paths in self.source_paths.items():
             # Convertir en liste si ce n'est pas déjà le cas
-            if isinstance(paths, (list, tuple)):
-                all_paths.extend(paths)
-            else:
-                all_paths.append(paths)
+            if not isinstance(paths, (list, tuple)):
+                paths = [paths]
+            all_paths.extend(paths)
+            for path in paths:
+                path_to_slugs.setdefault(path, []).append(source_slug)
         
         # Vérifier que tous les fichiers existent et sont accessibles
         valid_paths, invalid_paths = await asyncio.to_thread(
@@ -164,21 +364,18 @@ class UtilsMixin:
         self.console.print(f"[green]✓ {len(valid_paths)} fichiers valides à normaliser.[/green]")
         
         # Créer un dictionnaire pour suivre les fichiers valides par source
-        valid_files_by_source = {}
+        valid_files_by_source: Dict[str, List[Path]] = {}
         for path in valid_paths:
-            # Trouver à quelle source appartient ce fichier
-            for source_slug, source_paths in self.source_paths.items():
-                if isinstance(source_paths, (list, tuple)):
-                    if path in source_paths:
-                        if source_slug not in valid_files_by_source:
-                            valid_files_by_source[source_slug] = []
-                        valid_files_by_source[source_slug].append(path)
-                elif path == source_paths:
-                    if source_slug not in valid_files_by_source:
-                        valid_files_by_source[source_slug] = []
-                    valid_files_by_source[source_slug].append(path)
+            # Retrouver la ou les sources de ce fichier
+            for source_slug in path_to_slugs.get(path, ()):
+                valid_files_by_source.setdefault(source_slug, []).append(path)
         
-        # Traiter chaque source avec les fichiers valides
+        # Noms déjà pris : fichiers présents d'une exécution précédente (un seul listdir) puis noms choisis
+        used_names = set(os.listdir(self.normalized_dir))
+        # Dernier suffixe numérique essayé pour chaque nom de base
+        name_counters: Dict[str, int] = {}
+        # Choisir les noms de destination de toutes les sources avant de lancer les copies, pour qu'ils restent uniques
+        targets: List[Tuple[str, Path, Path]] = []
         for source_slug, paths in valid_files_by_source.items():
             self.console.print(f"[cyan]Normalisation de {source_slug} ({len(paths)} fichiers)...[/cyan]")
             
@@ -186,90 +383,37 @@ class UtilsMixin:
                 # Créer un nom de fichier normalisé en garantissant qu'il est unique
                 base_name = path.stem
                 extension = path.suffix
-                normalized_file_name = f"normalized_{source_slug}_{base_name}{extension}"
-                normalized_path = self.normalized_dir / normalized_file_name
-                
-                # Si le fichier existe déjà, ajouter un suffixe numérique
-                counter = 1
-                while normalized_path.exists():
-                    normalized_file_name = f"normalized_{source_slug}_{base_name}_{counter}{extension}"
-                    normalized_path = self.normalized_dir / normalized_file_name
-                    counter += 1
-                
-                # Vérifier si c'est un fichier binaire en utilisant notre fonction avancée
-                is_binary = await asyncio.to_thread(is_binary_file, path)
+                key = f"normalized_{source_slug}_{base_name}{extension}"
+                normalized_file_name = key
                 
-                # TODO: Implémenter une meilleure normalisation des données
-                # Pour l'instant, on copie simplement les fichiers
-                try:
-                    # Vérifier si c'est un fichier ou un dossier
-                    if path.is_file():
-                        # Pour les fichiers, utiliser copy2
-                        self.console.print(f"[cyan]Copie du fichier {path.name} vers {normalized_path}[/cyan]")
-                        await asyncio.to_thread(shutil.copy2, path, normalized_path)
-                    elif path.is_dir():
-                        # Pour les dossiers, utiliser copytree et créer un dossier avec le même nom normalisé
-                        self.console.print(f"[cyan]Copie récursive du dossier {path.name} vers {normalized_path}[/cyan]")
-                        # Si le dossier de destination existe déjà, il faut le supprimer d'abord
-                        if normalized_path.exists():
-                            await asyncio.to_thread(shutil.rmtree, normalized_path)
-                        await asyncio.to_thread(shutil.copytree, path, normalized_path)
-                    else:
-                        # Si ce n'est ni un fichier ni un dossier, c'est probablement un lien symbolique ou autre
-                        self.console.print(f"[yellow]Le chemin {path} n'est ni un fichier ni un dossier, ignoré.[/yellow]")
-                        continue
-                except Exception as e:
-                    self.console.print(f"[red]Erreur lors de la copie de {path} vers {normalized_path}: {e}[/red]")
-                    continue
-                
-                # Enregistrer le chemin normalisé pour cette source
-                if source_slug not in normalized_files:
-                    normalized_files[source_slug] = []
-                normalized_files[source_slug].append(normalized_path)
-                
-                # Compter les entrées normalisées
-                try:
-                    if normalized_path.is_file():
-                        if not is_binary:
-                            # Pour les fichiers texte, compter les lignes
-                            with open(normalized_path, "r", encoding="utf-8", errors="ignore") as f:
-                                lines = f.readlines()
-                                count = len(lines)
-                                normalized_count += count
-                                self.console.print(f"[green]Fichier {normalized_path.name} : {count} entrées normalisées[/green]")
-                        else:
-                            # Pour les fichiers binaires, ignorer le comptage des lignes mais noter la taille
-                            file_size = os.path.getsize(normalized_path)
-                            size_kb = file_size / 1024
-                            self.console.print(f"[yellow]Fichier binaire {normalized_path.name} copié ({size_kb:.2f} KB)[/yellow]")
-                    elif normalized_path.is_dir():
-                        # Pour les dossiers, compter récursivement le nombre de fichiers et la taille totale
-                        total_files = 0
-                        total_size = 0
-                        text_lines = 0
-                        
-                        for root, dirs, files in os.walk(normalized_path):
-                            for file in files:
-                                file_path = Path(root) / file
-                                total_files += 1
-                                file_size = os.path.getsize(file_path)
-                                total_size += file_size
-                                
-                                # Si c'est un fichier texte, compter les lignes pour les statistiques
-                                if not await asyncio.to_thread(is_binary_file, file_path):
-                                    try:
-                                        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                                            lines = f.readlines()
-                                            file_lines = len(lines)
-                                            text_lines += file_lines
-                                            normalized_count += file_lines
-                                    except Exception as e:
-                                        self.console.print(f"[yellow]Impossible de compter les lignes dans {file_path}: {e}[/yellow]")
-                        
-                        size_mb = total_size / (1024 * 1024)
-                        self.console.print(f"[cyan]Dossier {normalized_path.name} : {total_files} fichiers, {text_lines} lignes texte, {size_mb:.2f} MB[/cyan]")
-                except Exception as e:
-                    self.console.print(f"[red]Erreur lors du traitement de {normalized_path}: {e}[/red]")
+                # Si le nom est déjà pris, ajouter un suffixe numérique en reprenant au dernier essayé
+                if normalized_file_name in used_names:
+                    counter = name_counters.get(key, 0)
+                    while normalized_file_name in used_names:
+                        counter += 1
+                        normalized_file_name = f"normalized_{source_slug}_{base_name}_{counter}{extension}"
+                    name_counters[key] = counter
+                used_names.add(normalized_file_name)
+                targets.append((source_slug, path, self.normalized_dir / normalized_file_name))
+        
+        # Copies et comptages de tous les fichiers en parallèle, toutes sources confondues, bornés par un sémaphore
+        semaphore = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+        results = await asyncio.gather(*[
+            self._normalize_one(path, normalized_path, semaphore)
+            for _, path, normalized_path in targets
+        ])
+        
+        # Enregistrer les chemins normalisés par source, dans l'ordre des fichiers
+        file_stats: Dict[str, List[Tuple[str, str]]] = {}
+        for (source_slug, _, _), result in zip(targets, results, strict=True):
+            if result is None:
+                continue
+            normalized_path, count, detail = result
+            normalized_files.setdefault(source_slug, []).append(normalized_path)
+            normalized_count += count
+            file_stats.setdefault(source_slug, []).append((normalized_path.name, detail))
+        for source_slug, stats in file_stats.items():
+            self._print_file_stats(source_slug, stats)
         
         # Mettre à jour notre suivi des chemins normalisés
         self.normalized_paths = normalized_files
@@ -277,6 +421,93 @@ class UtilsMixin:
         self.stats['entries_normalized'] = normalized_count
         self.console.print(f"[bold green]✓ Normalisation terminée. {normalized_count} entrées normalisées.[/bold green]")
     
+    def _print_file_stats(self, title: str, file_stats: List[Tuple[str, str]]) -> None:
+        """
+        Affiche en un seul tableau le détail par fichier d'une source, au lieu d'un message par fichier.
+        
+        Args:
+            title: Titre du tableau (slug de la source)
+            file_stats: Couples (nom du fichier, détail avec balises rich)
+        """
+        if not file_stats:
+            return
+        table = Table(title=title)
+        table.add_column("Fichier", style="cyan")
+        table.add_column("Détail")
+        for name, detail in file_stats:
+            table.add_row(name, detail)
+        self.console.print(table)
+    
+    async def _normalize_one(self, path: Path, normalized_path: Path,
+                             semaphore: asyncio.Semaphore) -> Optional[Tuple[Path, int, str]]:
+        """
+        Copie un fichier (ou dossier) source vers son chemin normalisé et compte ses entrées.
+        
+        Args:
+            path: Fichier ou dossier source
+            normalized_path: Destination dans le répertoire normalized
+            semaphore: Sémaphore limitant le nombre de copies simultanées
+            
+        Returns:
+            Tuple (chemin normalisé, nombre d'entrées, détail pour le tableau récapitulatif),
+            ou None si la copie a échoué
+        """
+        async with semaphore:
+            # Vérifier si c'est un fichier binaire : l'extension suffit souvent, sinon notre fonction avancée
+            is_binary = path.suffix.lower() in BINARY_EXTENSIONS or await asyncio.to_thread(_is_binary_cached, path)
+            
+            # TODO: Implémenter une meilleure normalisation des données
+            # Pour l'instant, on copie simplement les fichiers
+            count = 0
+            try:
+                # Vérifier si c'est un fichier ou un dossier
+                if path.is_file():
+                    if is_binary:
+                        # Pour les fichiers binaires, copyfile suffit (sendfile côté noyau sous Linux, sans métadonnées)
+                        await asyncio.to_thread(shutil.copyfile, path, normalized_path)
+                    else:
+                        # Pour les fichiers texte, copier et compter les lignes en une seule passe
+                        count = await asyncio.to_thread(_copy_and_count, path, normalized_path)
+                elif path.is_dir():
+                    # Pour les dossiers, utiliser copytree et créer un dossier avec le même nom normalisé
+                    # Si le dossier de destination existe déjà, il faut le supprimer d'abord
+                    if normalized_path.exists():
+                        await asyncio.to_thread(shutil.rmtree, normalized_path)
+                    await asyncio.to_thread(_copytree_parallel, path, normalized_path)
+                else:
+                    # Si ce n'est ni un fichier ni un dossier, c'est probablement un lien symbolique ou autre
+                    self.console.print(f"[yellow]Le chemin {path} n'est ni un fichier ni un dossier, ignoré.[/yellow]")
+                    return None
+            except Exception as e:
+                self.console.print(f"[red]Erreur lors de la copie de {path} vers {normalized_path}: {e}[/red]")
+                return None
+            
+            # Compter les entrées normalisées
+            detail = ""
+            try:
+                if normalized_path.is_file():
+                    if not is_binary:
+                        # Pour les fichiers texte, les lignes ont été comptées pendant la copie
+                        detail = f"[green]{count} entrées normalisées[/green]"
+                    else:
+                        # Pour les fichiers binaires, ignorer le comptage des lignes mais noter la taille
+                        file_size = os.path.getsize(normalized_path)
+                        size_kb = file_size / 1024
+                        detail = f"[yellow]binaire copié ({size_kb:.2f} KB)[/yellow]"
+                elif normalized_path.is_dir():
+                    # Pour les dossiers, compter récursivement le nombre de fichiers et la taille totale
+                    total_files, total_size, text_lines, errors = await asyncio.to_thread(_summarize_dir, normalized_path)
+                    count += text_lines
+                    for file_path, e in errors:
+                        self.console.print(f"[yellow]Impossible de compter les lignes dans {file_path}: {e}[/yellow]")
+            
+                    size_mb = total_size / (1024 * 1024)
+                    detail = f"[cyan]dossier : {total_files} fichiers, {text_lines} lignes texte, {size_mb:.2f} MB[/cyan]"
+            except Exception as e:
+                self.console.print(f"[red]Erreur lors du traitement de {normalized_path}: {e}[/red]")
+            
+            return normalized_path, count, detail
+    
     @log_errors("Déduplication des données")
     async def run_deduplicate(self):
         """
@@ -295,7 +526,7 @@ class UtilsMixin:
         # Dédupliquer les chunks
         try:
             output_path = self.deduped_dir / "deduped_chunks.txt"
-            final_path = await asyncio.to_thread(
+            final_path, count = await asyncio.to_thread(
                 deduplicate_chunks,
                 split_dir,
                 output_path,
@@ -303,9 +534,6 @@ class UtilsMixin:
             )
             
             self.deduped_path = final_path
-            
-            # Compter les entrées dédupliquées
-            count = sum(1 for _ in open(final_path, "r", encoding="utf-8"))
             self.stats['entries_deduped'] = count
             
             self.console.print(f"[bold green]✓ Déduplication terminée. {count} entrées uniques.[/bold green]")
@@ -344,27 +572,38 @@ class UtilsMixin:
             # Récupérer les chemins des fichiers normalisés
             normalized_paths_dict = {slug: paths[0] if paths else None for slug, paths in self.normalized_paths.items()}
 
+            # Fichiers de sortie demandés, par type d'export
+            outputs: Dict[str, Path] = {}
+            for enabled, kind in ((export_emails, "emails"), (export_nicknames, "nicknames"), (export_passwords, "passwords")):
+                if enabled:
+                    output_dir = self.output_dir / kind
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    outputs[kind] = output_dir / f"{kind}.txt"
+            
+            if len(outputs) > 1:
+                # Plusieurs types demandés : une seule lecture du fichier dédupliqué pour tous les exports
+                await asyncio.to_thread(
+                    self._export_all_streaming,
+                    self.deduped_path,
+                    outputs.get("emails"),
+                    outputs.get("nicknames"),
+                    outputs.get("passwords")
+                )
+            elif outputs:
+                (kind, output_file), = outputs.items()
+                export_only = {
+                    "emails": self._export_emails_only,
+                    "nicknames": self._export_nicknames_only,
+                    "passwords": self._export_passwords_only,
+                }[kind]
+                await asyncio.to_thread(export_only, self.deduped_path, output_file)
+            
             if export_emails:
-                # Export emails séparé
-                output_dir = self.output_dir / "emails"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_file = output_dir / "emails.txt"
-                await asyncio.to_thread(self._export_emails_only, self.deduped_path, output_file)
-                self.console.print(f"[green]✓ Exportation des emails terminée : {output_file}[/green]")
+                self.console.print(f"[green]✓ Exportation des emails terminée : {outputs['emails']}[/green]")
             if export_nicknames:
-                # Export nicknames séparé
-                output_dir = self.output_dir / "nicknames"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_file = output_dir / "nicknames.txt"
-                await asyncio.to_thread(self._export_nicknames_only, self.deduped_path, output_file)
-                self.console.print(f"[green]✓ Exportation des pseudonymes terminée : {output_file}[/green]")
+                self.console.print(f"[green]✓ Exportation des pseudonymes terminée : {outputs['nicknames']}[/green]")
             if export_passwords:
-                # Export passwords séparé
-                output_dir = self.output_dir / "passwords"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_file = output_dir / "passwords.txt"
-                await asyncio.to_thread(self._export_passwords_only, self.deduped_path, output_file)
-                self.console.print(f"[green]✓ Exportation des mots de passe terminée : {output_file}[/green]")
+                self.console.print(f"[green]✓ Exportation des mots de passe terminée : {outputs['passwords']}[/green]")
             if not (export_emails or export_nicknames or export_passwords):
                 # Export standard
                 final_path = await asyncio.to_thread(
@@ -380,7 +619,7 @@ class UtilsMixin:
         """
         Exporte uniquement les emails depuis le fichier source_path vers output_file.
         """
-        with open(source_path, "r", encoding="utf-8", errors="ignore") as fin, open(output_file, "w", encoding="utf-8") as fout:
+        with open(source_path, "r", encoding="utf-8", errors="ignore", buffering=EXPORT_BUFFER_SIZE) as fin, open(output_file, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as fout:
             for line in fin:
                 if "@" in line and "." in line:  # Filtrage simple d'email
                     fout.write(line)
@@ -389,7 +628,7 @@ class UtilsMixin:
         """
         Exporte uniquement les pseudonymes depuis le fichier source_path vers output_file.
         """
-        with open(source_path, "r", encoding="utf-8", errors="ignore") as fin, open(output_file, "w", encoding="utf-8") as fout:
+        with open(source_path, "r", encoding="utf-8", errors="ignore", buffering=EXPORT_BUFFER_SIZE) as fin, open(output_file, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as fout:
             for line in fin:
                 if "@" not in line and len(line.strip()) > 0:  # Pas d'@, donc probablement un nickname
                     fout.write(line)
@@ -398,20 +637,59 @@ class UtilsMixin:
         """
         Exporte uniquement les mots de passe depuis le fichier source_path vers output_file.
         """
-        with open(source_path, "r", encoding="utf-8", errors="ignore") as fin, open(output_file, "w", encoding="utf-8") as fout:
+        with open(source_path, "r", encoding="utf-8", errors="ignore", buffering=EXPORT_BUFFER_SIZE) as fin, open(output_file, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as fout:
             for line in fin:
                 # Mot de passe : ni @ ni espace, longueur > 6, pas vide
                 if "@" not in line and " " not in line and len(line.strip()) > 6:
                     fout.write(line)
 
+
+    def _export_all_streaming(
+        self,
+        source_path: Path,
+        emails_file: Optional[Path],
+        nicknames_file: Optional[Path],
+        passwords_file: Optional[Path]
+    ) -> None:
+        """
+        Exporte en une seule lecture de source_path les emails, pseudonymes et mots de passe,
+        avec les mêmes filtres que _export_emails_only, _export_nicknames_only et _export_passwords_only.
+        
+        Args:
+            source_path: Fichier dédupliqué à lire
+            emails_file: Fichier de sortie des emails, ou None pour ne pas les exporter
+            nicknames_file: Fichier de sortie des pseudonymes, ou None pour ne pas les exporter
+            passwords_file: Fichier de sortie des mots de passe, ou None pour ne pas les exporter
+        """
+        with ExitStack() as stack:
+            def open_output(path: Optional[Path]) -> Optional[TextIO]:
+                return stack.enter_context(open(path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE)) if path is not None else None
+            
+            fin = stack.enter_context(open(source_path, "r", encoding="utf-8", errors="ignore", buffering=EXPORT_BUFFER_SIZE))
+            _advise_sequential(fin)
+            write_email = getattr(open_output(emails_file), "write", None)
+            write_nickname = getattr(open_output(nicknames_file), "write", None)
+            write_password = getattr(open_output(passwords_file), "write", None)
+            
+            for line in fin:
+                if "@" in line:
+                    # Filtrage simple d'email ; une ligne avec @ n'est ni un pseudonyme ni un mot de passe
+                    if write_email is not None and "." in line:
+                        write_email(line)
+                    continue
+                length = len(line.strip())
+                if length and write_nickname is not None:
+                    write_nickname(line)
+                # Mot de passe : ni @ ni espace, longueur > 6
+                if length > 6 and write_password is not None and " " not in line:
+                    write_password(line)
             
     async def run_export_all(self):
         """
-        Exporte tous les types (pseudonymes, emails, mots de passe) dans leurs dossiers/fichiers respectifs.
+        Exporte tous les types (pseudonymes, emails, mots de passe) dans leurs dossiers/fichiers respectifs,
+        en une seule lecture du fichier dédupliqué.
         """
-        await self.run_export_nicknames()
-        await self.run_export_emails()
-        await self.run_export_passwords()
+        await self.run_export(export_emails=True, export_nicknames=True, export_passwords=True)
 
     @capture_errors("Exportation des pseudos")
     async def run_export_nicknames(self):
@@ -14,6 +14,21 @@ from rich.progress import Progress, TaskID
 # Initialiser la console pour les logs colorés
 console = Console()
 
+# Caractères invalides dans les noms de fichiers Windows
+_INVALID_CHARS = '<>:"/\\|?*'
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+# Table de remplacement des caractères invalides par _, appliquée en une passe par str.translate
+_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys(_INVALID_CHARS, '_'))
+
+# Catégorie de rangement par extension (sans le point) ; les autres extensions vont dans 'others'
+_EXT_CATEGORY = {
+    **dict.fromkeys(('txt', 'csv', 'tsv', 'list'), 'text'),
+    **dict.fromkeys(('zip', 'tar', 'gz', 'tgz', 'rar', '7z'), 'archives'),
+    **dict.fromkeys(('jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg'), 'images'),
+    **dict.fromkeys(('json', 'xml', 'yaml', 'yml'), 'structured'),
+    **dict.fromkeys(('md', 'rst', 'html', 'pdf', 'doc', 'docx'), 'documents'),
+}
+
 def is_valid_filename(filename):
     """
     Vérifie si un nom de fichier est valide.
@@ -24,15 +39,12 @@ def is_valid_filename(filename):
     Returns:
         bool: True si le nom est valide, False sinon
     """
-    # Caractères invalides dans les noms de fichiers Windows
-    invalid_chars = r'[<>:"/\\|?*]'
-    
     # Vérifier la longueur du chemin complet (max 255 caractères pour Windows)
     if len(filename) > 255:
         return False
         
     # Vérifier les caractères invalides
-    if re.search(invalid_chars, filename):
+    if _INVALID_CHARS_RE.search(filename):
         return False
         
     # Éviter les espaces ou points en début/fin
@@ -52,8 +64,7 @@ def fix_filename(filename):
         str: Nom de fichier corrigé
     """
     # Remplacer les caractères invalides
-    invalid_chars = r'[<>:"/\\|?*]'
-    clean_name = re.sub(invalid_chars, '_', filename)
+    clean_name = filename.translate(_INVALID_CHARS_TABLE)
     
     # Tronquer si trop long
     if len(clean_name) > 255:
@@ -69,13 +80,15 @@ def fix_filename(filename):
         
     return clean_name
 
-def organize_by_extension(file_path, dest_dir):
+def organize_by_extension(file_path, dest_dir, used_names=None):
     """
     Organise les fichiers par extension.
     
     Args:
         file_path: Chemin du fichier à organiser
         dest_dir: Répertoire de destination
+        used_names: Noms déjà pris par répertoire de catégorie, partagé entre les appels.
+            Chaque répertoire n'est alors listé qu'une fois, au lieu d'un appel à exists() par essai de nom.
     
     Returns:
         Path: Nouveau chemin du fichier
@@ -83,37 +96,41 @@ def organize_by_extension(file_path, dest_dir):
     ext = file_path.suffix.lower().lstrip('.')
     
     # Regrouper par type de fichier
-    if ext in ('txt', 'csv', 'tsv', 'list'):
-        category = 'text'
-    elif ext in ('zip', 'tar', 'gz', 'tgz', 'rar', '7z'):
-        category = 'archives'
-    elif ext in ('jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg'):
-        category = 'images'
-    elif ext in ('json', 'xml', 'yaml', 'yml'):
-        category = 'structured'
-    elif ext in ('md', 'rst', 'html', 'pdf', 'doc', 'docx'):
-        category = 'documents'
-    else:
-        category = 'others'
+    category = _EXT_CATEGORY.get(ext, 'others')
         
-    # Créer le répertoire de destination s'il n'existe pas
     category_dir = dest_dir / category
-    category_dir.mkdir(exist_ok=True, parents=True)
-    
-    # Construire le nouveau chemin
-    new_path = category_dir / file_path.name
+    if used_names is None:
+        used_names = {}
+    names = used_names.get(category_dir)
+    if names is None:
+        # Première utilisation de cette catégorie : créer le répertoire s'il n'existe pas et relever ses fichiers
+        category_dir.mkdir(exist_ok=True, parents=True)
+        names = used_names[category_dir] = set(os.listdir(category_dir))
     
-    # S'il y a un conflit de nom, ajouter un suffixe
+    # S'il y a un conflit de nom, ajouter un suffixe (vérifié en mémoire)
+    new_name = file_path.name
     counter = 1
-    base_name = file_path.stem
-    while new_path.exists():
-        new_name = f"{base_name}_{counter}{file_path.suffix}"
-        new_path = category_dir / new_name
+    while new_name in names:
+        new_name = f"{file_path.stem}_{counter}{file_path.suffix}"
         counter += 1
-        
-    return new_path
+    names.add(new_name)
+    return category_dir / new_name
+
+def move_file(src, dst):
+    """
+    Déplace un fichier : simple renommage (os.replace) sur le même système de fichiers,
+    sinon copie puis suppression via shutil.move.
+    
+    Args:
+        src: Fichier à déplacer
+        dst: Chemin de destination (remplacé s'il existe déjà)
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
 
-def process_directory(dir_path, dest_dir=None, recursive=True):
+def process_directory(dir_path, dest_dir=None, recursive=True, used_names=None):
     """
     Traite un répertoire pour corriger les noms de fichiers et l'organisation.
     
@@ -121,6 +138,7 @@ def process_directory(dir_path, dest_dir=None, recursive=True):
         dir_path: Chemin du répertoire à traiter
         dest_dir: Répertoire de destination (si None, utilise le même répertoire)
         recursive: Si True, traite également les sous-répertoires
+        used_names: Noms déjà pris par répertoire de catégorie (créé au premier appel, partagé en récursion)
         
     Returns:
         tuple: (nombre de fichiers traités, nombre de fichiers renommés)
@@ -138,9 +156,12 @@ def process_directory(dir_path, dest_dir=None, recursive=True):
         return 0, 0
         
     dest_dir.mkdir(exist_ok=True, parents=True)
+    if used_names is None:
+        used_names = {}
     
-    # Récupérer tous les fichiers et dossiers
-    items = list(dir_path.glob('*'))
+    # Récupérer tous les fichiers et dossiers ; les DirEntry de scandir connaissent déjà leur type
+    with os.scandir(dir_path) as it:
+        items = list(it)
     processed = 0
     renamed = 0
     total_items = len(items)
@@ -155,7 +176,7 @@ def process_directory(dir_path, dest_dir=None, recursive=True):
         
         if item.is_dir() and recursive:
             # Traiter récursivement les sous-répertoires
-            sub_processed, sub_renamed = process_directory(item, dest_dir / item.name, recursive)
+            sub_processed, sub_renamed = process_directory(item.path, dest_dir / item.name, recursive, used_names)
             processed += sub_processed
             renamed += sub_renamed
         elif item.is_file():
@@ -171,19 +192,19 @@ def process_directory(dir_path, dest_dir=None, recursive=True):
                 new_name = item.name
             
             # Déterminer la destination
-            dest_path = organize_by_extension(item.with_name(new_name), dest_dir)
+            dest_path = organize_by_extension(dir_path / new_name, dest_dir, used_names)
             
             try:
                 # Copier/déplacer le fichier
                 if dir_path == dest_dir:
                     # Si même répertoire, renommer
                     if item.name != dest_path.name:
-                        shutil.move(item, dest_path)
+                        shutil.move(item.path, dest_path)
                 else:
                     # Sinon, copier
-                    shutil.copy2(item, dest_path)
+                    shutil.copy2(item.path, dest_path)
             except Exception as e:
-                console.print(f"[red]Erreur lors du traitement de {item}: {e}[/red]")
+                console.print(f"[red]Erreur lors du traitement de {item.path}: {e}[/red]")
     
     return processed, renamed
 
@@ -250,8 +271,8 @@ def clean_raw_directory(data_dir, organize=True):
                 if item != backup_dir:  # Ne pas déplacer le dossier backup dans lui-même
                     try:
                         if item.is_file():
-                            # Copier chaque fichier individuellement
-                            shutil.copy2(item, backup_dir / item.name)
+                            # Déplacer chaque fichier individuellement (renommage, sans recopier les données)
+                            move_file(item, backup_dir / item.name)
                             file_count += 1
                     except Exception as e:
                         console.print(f"[yellow]Erreur lors de la sauvegarde de {item}: {e}[/yellow]")
@@ -259,17 +280,17 @@ def clean_raw_directory(data_dir, organize=True):
             console.print(f"[green]{file_count} fichiers sauvegardés dans {backup_dir}[/green]")
             
             # Copier les nouveaux fichiers organisés dans le répertoire raw
-            console.print("[blue]Copie des fichiers organisés...[/blue]")
+            console.print("[blue]Déplacement des fichiers organisés...[/blue]")
             for category_dir in temp_dir.glob('*'):
                 if category_dir.is_dir():
                     # Créer le répertoire de catégorie s'il n'existe pas
                     target_dir = raw_dir / category_dir.name
                     target_dir.mkdir(exist_ok=True, parents=True)
                     
-                    # Copier tous les fichiers de cette catégorie
+                    # Déplacer tous les fichiers de cette catégorie (le répertoire temporaire est supprimé ensuite)
                     for file in category_dir.glob('*'):
                         if file.is_file():
-                            shutil.copy2(file, target_dir / file.name)
+                            move_file(file, target_dir / file.name)
             
             # Supprimer le répertoire temporaire
             shutil.rmtree(temp_dir, ignore_errors=True)
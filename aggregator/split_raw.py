@@ -3,8 +3,53 @@ Module pour fractionner les fichiers bruts en plusieurs fichiers txt de taille l
 """
 
 from pathlib import Path
+from typing import BinaryIO, Iterator
 from rich.console import Console
 
+# Taille des lectures binaires dans les fichiers d'entrée
+READ_SIZE = 1024 * 1024
+
+
+def _as_text_bytes(block: bytes) -> bytes:
+    """
+    Renvoie block tel que l'aurait produit une lecture en mode texte (utf-8, errors="ignore")
+    puis une écriture en utf-8 : octets invalides retirés, \r\n et \r convertis en \n.
+    Chemin rapide : un bloc utf-8 valide sans \r est renvoyé tel quel.
+    """
+    if b'\r' not in block:
+        if block.isascii():
+            return block
+        try:
+            block.decode('utf-8')
+            return block
+        except UnicodeDecodeError:
+            pass
+    return block.decode('utf-8', 'ignore').replace('\r\n', '\n').replace('\r', '\n').encode('utf-8')
+
+
+def _iter_text_blocks(path: Path) -> Iterator[bytes]:
+    """
+    Lit path par blocs de READ_SIZE octets et produit des blocs de lignes complètes
+    (seule la dernière ligne du fichier peut ne pas se terminer par \n).
+    """
+    carry = b''
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(READ_SIZE)
+            if not data:
+                break
+            cut = data.rfind(b'\n') + 1
+            if not cut:
+                carry += data
+                continue
+            yield _as_text_bytes(carry + data[:cut] if carry else data[:cut] if cut < len(data) else data)
+            carry = data[cut:]
+    if carry:
+        # Une dernière ligne faite uniquement d'octets invalides disparaît au décodage, comme en mode texte
+        tail = _as_text_bytes(carry)
+        if tail:
+            yield tail
+
 
 def split_raw_files(
     input_dir: Path,
@@ -15,29 +60,44 @@ def split_raw_files(
     """
     Scinde tous les fichiers .txt, .csv, .tsv de input_dir en fichiers txt
     de taille max max_lines lignes, dans output_dir.
+    Les fichiers sont copiés par blocs binaires ; les lignes sont comptées avec bytes.count.
     """
+    # Comme la boucle ligne à ligne d'origine, une limite inférieure à 1 revient à une ligne par fichier
+    max_lines = max(max_lines, 1)
     # Créer le dossier de sortie
     output_dir.mkdir(parents=True, exist_ok=True)
     file_index = 1
     line_count = 0
     # Ouvrir le premier fichier de sortie
     out_path = output_dir / f"chunk_{file_index:03d}.txt"
-    f_out = out_path.open("w", encoding="utf-8")
+    f_out: BinaryIO = out_path.open("wb")
 
     for pattern in ("*.txt", "*.csv", "*.tsv"):
         for infile in input_dir.rglob(pattern):
             if console:
                 console.print(f"Traitement de {infile}…")
-            with infile.open("r", encoding="utf-8", errors="ignore") as f_in:
-                for line in f_in:
-                    f_out.write(line)
-                    line_count += 1
-                    if line_count >= max_lines:
-                        f_out.close()
-                        file_index += 1
-                        line_count = 0
-                        out_path = output_dir / f"chunk_{file_index:03d}.txt"
-                        f_out = out_path.open("w", encoding="utf-8")
+            for block in _iter_text_blocks(infile):
+                view = memoryview(block)
+                # Une dernière ligne sans \n final compte comme une ligne, comme en mode texte
+                block_lines = block.count(b'\n') + (not block.endswith(b'\n'))
+                pos = 0
+                while block_lines >= max_lines - line_count:
+                    # Le chunk courant se remplit dans ce bloc : écrire jusqu'à sa dernière ligne
+                    needed = max_lines - line_count
+                    end = pos
+                    for _ in range(needed):
+                        end = block.find(b'\n', end) + 1 or len(block)
+                    f_out.write(view[pos:end])
+                    block_lines -= needed
+                    pos = end
+                    f_out.close()
+                    file_index += 1
+                    line_count = 0
+                    out_path = output_dir / f"chunk_{file_index:03d}.txt"
+                    f_out = out_path.open("wb")
+                if pos < len(block):
+                    f_out.write(view[pos:])
+                    line_count += block_lines
 
     # Fermer le dernier fichier
     f_out.close()
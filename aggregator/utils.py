@@ -7,8 +7,17 @@ from typing import List
 """
 Utilitaires pour la gestion des fichiers de données et du cache.
 """
+import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
+
+# Dernier fichier de données trouvé par has_valid_data_files, indexé par (dossier, extensions valides)
+_DATA_FILE_HITS: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+
+def _suffix_tuple(valid_exts: List[str]) -> Tuple[str, ...]:
+    """Extensions en minuscules, sous forme de tuple utilisable directement par str.endswith."""
+    return tuple(sorted({ext.lower() for ext in valid_exts if ext}))
 
 def is_valid_data_file(path: Path, valid_exts: List[str]) -> bool:
     """
@@ -19,21 +28,41 @@ def is_valid_data_file(path: Path, valid_exts: List[str]) -> bool:
     Returns:
         bool: True si le fichier est un fichier de données valide
     """
-    return path.is_file() and path.suffix.lower() in valid_exts and not path.name.startswith('.')
+    name = path.name
+    return (not name.startswith('.') and name.lower().endswith(_suffix_tuple(valid_exts))
+            and path.is_file())
 
 def has_valid_data_files(directory: Path, valid_exts: List[str]) -> bool:
     """
     Parcourt récursivement un dossier pour détecter au moins un fichier de données valide.
+    Le parcours utilise os.scandir (type des entrées connu sans stat supplémentaire, aucun Path créé)
+    et s'arrête au premier fichier trouvé ; un dossier illisible est simplement ignoré.
+    Le fichier trouvé est mémorisé : tant qu'il existe, les appels suivants répondent sans parcours.
+    Un résultat négatif n'est jamais mémorisé.
     Args:
         directory: Dossier à parcourir
         valid_exts: Extensions considérées comme valides
     Returns:
         bool: True si au moins un fichier de données est trouvé
     """
-    try:
-        for f in directory.rglob('*'):
-            if is_valid_data_file(f, valid_exts):
-                return True
-    except (PermissionError, FileNotFoundError):
-        pass
+    exts = _suffix_tuple(valid_exts)
+    root = os.fspath(directory)
+    key = (root, exts)
+    hit = _DATA_FILE_HITS.get(key)
+    if hit is not None and os.path.isfile(hit):
+        return True
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # Comme rglob, ne pas suivre les liens symboliques vers des dossiers
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (not entry.name.startswith('.') and entry.name.lower().endswith(exts)
+                          and entry.is_file()):
+                        _DATA_FILE_HITS[key] = entry.path
+                        return True
+        except OSError:
+            continue
     return False
@@ -7,32 +7,40 @@ Permet de lancer l'application avec la commande `python run_menu.py`.
 import sys
 import traceback
 
-def main():
-    """Point d'entrée principal pour l'application."""
-    config_path = "config.yaml"
-    
-    # Demande de la langue à l'utilisateur
-    print("\n===== Aggregator Nickname =====\n")
-    print("Choisissez la langue / Choose language:")
-    print("1. Français (par défaut/default)")
-    print("2. English")
+# Menu de choix de la langue, écrit en une seule fois
+_LANG_MENU = (
+    "\n===== Aggregator Nickname =====\n\n"
+    "Choisissez la langue / Choose language:\n"
+    "1. Français (par défaut/default)\n"
+    "2. English\n"
+)
+
+def _choose_lang() -> str:
+    """Affiche le menu et renvoie la langue choisie ("fr" par défaut)."""
+    sys.stdout.write(_LANG_MENU)
+    sys.stdout.flush()
     
     try:
         choice = input("Choix/Choice [1-2]: ").strip()
-        # Par défaut, utiliser le français
-        lang = "fr"
-        
-        if choice == "2":
-            lang = "en"
-            print("\nEnglish interface selected.\n")
-        else:
-            print("\nInterface française sélectionnée.\n")
     except (KeyboardInterrupt, EOFError):
         # Si l'utilisateur interrompt, utiliser le français par défaut
         print("\nUtilisation de l'interface en français (par défaut).\n")
-        lang = "fr"
+        return "fr"
+    
+    if choice == "2":
+        print("\nEnglish interface selected.\n")
+        return "en"
+    print("\nInterface française sélectionnée.\n")
+    return "fr"
+
+def main():
+    """Point d'entrée principal pour l'application."""
+    config_path = "config.yaml"
     
     try:
+        # Demande de la langue à l'utilisateur
+        lang = _choose_lang()
+        
         # Utilisation de la fonction run() du module aggregator
         from aggregator import run
         
@@ -50,9 +58,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    try:
-        main()
-    except Exception as e:
-        print(f"\nErreur critique: {e}")
-        traceback.print_exc()
-        sys.exit(1)
+    main()
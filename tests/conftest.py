@@ -1,7 +1,36 @@
-# Conftest pour ajouter le répertoire racine au PYTHONPATH
+# Conftest : ajout du répertoire racine au PYTHONPATH et fixtures partagées
+import os
 import sys
-from pathlib import Path
+
+import pytest
 
 # Ajouter le répertoire racine au début du chemin pour permettre l'import du package aggregator
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aggregator.config import Config, Source, Defaults  # noqa: E402
+
 
+@pytest.fixture(scope="session")
+def test_config():
+    """Configuration de test partagée (les modèles sont immuables, aucun test ne peut la modifier)."""
+    return Config(
+        sources=[
+            Source(
+                slug="test1",
+                type="git",
+                ref="test_ref1",
+                repo="test/repo1"
+            ),
+            Source(
+                slug="test2",
+                type="http",
+                ref="test_ref2",
+                url="http://example.com/data.zip"
+            )
+        ],
+        defaults=Defaults(
+            cache_dir="data/raw",
+            force=True,
+            workers=16
+        )
+    )
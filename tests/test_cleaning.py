@@ -0,0 +1,70 @@
+"""
+Tests unitaires pour le nettoyage : un lien ne doit jamais entraîner la suppression
+ni la modification de sa cible.
+"""
+import os
+import stat
+
+import pytest
+
+from aggregator.orchestration import cleaning
+from aggregator.orchestration.cleaning import _delete_item, _find_git_dirs, _list_entries, _purge_tree
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt",
+                                reason="liens symboliques POSIX requis")
+
+
+def make_repo(base):
+    """Crée un faux dépôt .git contenant quelques fichiers."""
+    git_dir = base / ".git"
+    (git_dir / "objects").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "objects" / "ab").write_text("x", encoding="utf-8")
+    return git_dir
+
+
+def test_find_git_dirs_signale_les_liens(tmp_path):
+    main_git = make_repo(tmp_path)
+    (tmp_path / "sub").mkdir()
+    os.symlink(main_git, tmp_path / "sub" / ".git")
+    make_repo(tmp_path / "autre")
+
+    found = sorted(_find_git_dirs(tmp_path, skip={".git"}))
+
+    assert found == [
+        (tmp_path / "autre" / ".git", False),
+        (tmp_path / "sub" / ".git", True),
+    ]
+
+
+def test_purge_lien_git_preserve_la_cible(tmp_path, monkeypatch):
+    # Forcer le chemin rsync même pour un petit arbre : il ne doit jamais recevoir le lien
+    monkeypatch.setattr(cleaning, "RSYNC_MIN_ENTRIES", 0)
+    main_git = make_repo(tmp_path)
+    trash_entry = tmp_path / "_trash" / "lien"
+    trash_entry.parent.mkdir()
+    os.symlink(main_git, trash_entry)
+
+    _purge_tree(trash_entry)
+
+    assert not os.path.lexists(trash_entry)
+    assert (main_git / "HEAD").read_text(encoding="utf-8") == "ref: refs/heads/main\n"
+    assert (main_git / "objects" / "ab").exists()
+
+
+def test_delete_item_lien_preserve_les_droits_de_la_cible(tmp_path):
+    outside = tmp_path / "dehors"
+    outside.mkdir()
+    (outside / "f.txt").write_text("x", encoding="utf-8")
+    os.chmod(outside, 0o700)
+    to_clear = tmp_path / "raw"
+    to_clear.mkdir()
+    os.symlink(outside, to_clear / "lien")
+    (to_clear / "data.txt").write_text("x", encoding="utf-8")
+
+    for entry in _list_entries(to_clear):
+        _delete_item(entry)
+
+    assert os.listdir(to_clear) == []
+    assert stat.S_IMODE(os.stat(outside).st_mode) == 0o700
+    assert (outside / "f.txt").exists()
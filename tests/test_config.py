@@ -2,8 +2,7 @@
 Tests unitaires pour le module de configuration.
 """
 
-import os
-import tempfile
+import io
 from pathlib import Path
 
 import pytest
@@ -84,11 +83,11 @@ def test_config_model():
     assert config.defaults.cache_dir == "custom/path"
 
 
-def test_load_config():
+def test_load_config(tmp_path):
     """Test du chargement de la configuration depuis un fichier YAML."""
     # Créer un fichier YAML temporaire
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write("""
+    config_path = tmp_path / "cfg.yaml"
+    config_path.write_text("""
 sources:
   - slug: test1
     type: git
@@ -102,10 +101,10 @@ defaults:
   cache_dir: custom/path
   force: true
   workers: 16
-        """)
+        """, encoding="utf-8")
     
     # Charger la configuration
-    config = load_config(f.name)
+    config = load_config(str(config_path))
     
     # Vérifier la configuration
     assert len(config.sources) == 2
@@ -120,21 +119,23 @@ defaults:
     assert config.defaults.cache_dir == "custom/path"
     assert config.defaults.force is True
     assert config.defaults.workers == 16
+
+
+def test_load_config_stream():
+    """Test du chargement de la configuration depuis un flux texte, sans fichier."""
+    config = load_config(io.StringIO("sources:\n  - slug: test1\n    type: git\n    ref: test_ref1\n"))
     
-    # Supprimer le fichier temporaire
-    os.unlink(f.name)
+    assert config.sources[0].slug == "test1"
+    assert config.defaults.cache_dir == "data/raw"
 
 
-def test_load_config_invalid_yaml():
+def test_load_config_invalid_yaml(tmp_path):
     """Test du chargement d'un fichier YAML invalide."""
     # Créer un fichier YAML temporaire invalide
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write("invalid: yaml: content:")
+    config_path = tmp_path / "cfg.yaml"
+    config_path.write_text("invalid: yaml: content:", encoding="utf-8")
     
     # Vérifier que le chargement échoue
     with pytest.raises(Exception):
-        load_config(f.name)
-    
-    # Supprimer le fichier temporaire
-    os.unlink(f.name)
+        load_config(str(config_path))
 
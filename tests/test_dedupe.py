@@ -9,36 +9,9 @@ from pathlib import Path
 import polars as pl
 import pytest
 
-from aggregator.config import Config, Source, Defaults
 from aggregator.dedupe import Deduplicator, deduplicate_sources
 
 
-@pytest.fixture
-def test_config():
-    """Fixture pour créer une configuration de test."""
-    return Config(
-        sources=[
-            Source(
-                slug="test1",
-                type="git",
-                ref="test_ref1",
-                repo="test/repo1"
-            ),
-            Source(
-                slug="test2",
-                type="http",
-                ref="test_ref2",
-                url="http://example.com/data.zip"
-            )
-        ],
-        defaults=Defaults(
-            cache_dir="data/raw",
-            force=True,
-            workers=16
-        )
-    )
-
-
 @pytest.fixture
 def test_normalized_paths(tmp_path):
     """Fixture pour créer des chemins normalisés de test."""
@@ -48,13 +21,13 @@ def test_normalized_paths(tmp_path):
     # Premier fichier avec des données
     df1 = pl.DataFrame({"nick": ["user1", "user2", "user3", "common"]})
     path1 = tmp_path / "test1.parquet"
-    df1.write_parquet(path1)
+    df1.write_parquet(path1, compression="uncompressed")
     paths["test1"] = path1
     
     # Deuxième fichier avec des données (incluant des doublons)
     df2 = pl.DataFrame({"nick": ["user4", "user5", "common", "user3"]})
     path2 = tmp_path / "test2.parquet"
-    df2.write_parquet(path2)
+    df2.write_parquet(path2, compression="uncompressed")
     paths["test2"] = path2
     
     return paths
@@ -87,13 +60,8 @@ def test_deduplicate_all(test_config, test_normalized_paths):
     
     # Vérifier que l'ordre de priorité est respecté (test1 avant test2)
     # Les doublons de test2 ne doivent pas apparaître
-    nick_list = df["nick"].to_list()
-    assert "user1" in nick_list
-    assert "user2" in nick_list
-    assert "user3" in nick_list  # De test1, pas de test2
-    assert "common" in nick_list  # De test1, pas de test2
-    assert "user4" in nick_list
-    assert "user5" in nick_list
+    expected = ["user1", "user2", "user3", "common", "user4", "user5"]  # user3 et common viennent de test1
+    assert set(df.filter(pl.col("nick").is_in(expected))["nick"].to_list()) == set(expected)
 
 
 def test_deduplicate_high_volume(test_config, test_normalized_paths):
@@ -114,11 +82,6 @@ def test_deduplicate_high_volume(test_config, test_normalized_paths):
     assert "nick" in df.columns
     
     # Vérifier que toutes les entrées uniques sont présentes
-    nick_set = set(df["nick"].to_list())
-    assert "user1" in nick_set
-    assert "user2" in nick_set
-    assert "user3" in nick_set
-    assert "user4" in nick_set
-    assert "user5" in nick_set
-    assert "common" in nick_set
+    expected = ["user1", "user2", "user3", "user4", "user5", "common"]
+    assert set(df.filter(pl.col("nick").is_in(expected))["nick"].to_list()) == set(expected)
 
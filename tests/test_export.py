@@ -9,43 +9,16 @@ from pathlib import Path
 import polars as pl
 import pytest
 
-from aggregator.config import Config, Source, Defaults
 from aggregator.export import Exporter, export_data
 
 
-@pytest.fixture
-def test_config():
-    """Fixture pour créer une configuration de test."""
-    return Config(
-        sources=[
-            Source(
-                slug="test1",
-                type="git",
-                ref="test_ref1",
-                repo="test/repo1"
-            ),
-            Source(
-                slug="test2",
-                type="http",
-                ref="test_ref2",
-                url="http://example.com/data.zip"
-            )
-        ],
-        defaults=Defaults(
-            cache_dir="data/raw",
-            force=True,
-            workers=16
-        )
-    )
-
-
 @pytest.fixture
 def test_deduped_path(tmp_path):
     """Fixture pour créer un fichier dédupliqué de test."""
     # Créer un fichier parquet de test
     df = pl.DataFrame({"nick": ["user1", "user2", "user3", "user4", "user5"]})
     path = tmp_path / "deduped.parquet"
-    df.write_parquet(path)
+    df.write_parquet(path, compression="uncompressed")
     return path
 
 
@@ -61,7 +34,7 @@ def test_normalized_paths(tmp_path):
         "original": ["User1", "USER2", "User_3"]
     })
     path1 = tmp_path / "test1.parquet"
-    df1.write_parquet(path1)
+    df1.write_parquet(path1, compression="uncompressed")
     paths["test1"] = path1
     
     # Deuxième fichier avec des données
@@ -70,7 +43,7 @@ def test_normalized_paths(tmp_path):
         "original": ["User-4", "User.5"]
     })
     path2 = tmp_path / "test2.parquet"
-    df2.write_parquet(path2)
+    df2.write_parquet(path2, compression="uncompressed")
     paths["test2"] = path2
     
     return paths
@@ -123,7 +96,7 @@ def test_export_with_original(test_config, test_deduped_path, test_normalized_pa
     assert "original" in df.columns
     
     # Vérifier que les formes originales sont correctes
-    nick_to_original = {row[0]: row[1] for row in df.iter_rows()}
+    nick_to_original = dict(zip(df["nick"].to_list(), df["original"].to_list(), strict=True))
     assert nick_to_original["user1"] == "User1"
     assert nick_to_original["user2"] == "USER2"
     assert nick_to_original["user3"] == "User_3"
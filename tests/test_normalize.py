@@ -9,36 +9,9 @@ from pathlib import Path
 import polars as pl
 import pytest
 
-from aggregator.config import Config, Source, Defaults
 from aggregator.normalize import Normalizer, normalize_sources
 
 
-@pytest.fixture
-def test_config():
-    """Fixture pour créer une configuration de test."""
-    return Config(
-        sources=[
-            Source(
-                slug="test1",
-                type="git",
-                ref="test_ref1",
-                repo="test/repo1"
-            ),
-            Source(
-                slug="test2",
-                type="http",
-                ref="test_ref2",
-                url="http://example.com/data.zip"
-            )
-        ],
-        defaults=Defaults(
-            cache_dir="data/raw",
-            force=True,
-            workers=16
-        )
-    )
-
-
 @pytest.fixture
 def test_dataframe():
     """Fixture pour créer un DataFrame de test."""
@@ -0,0 +1,43 @@
+"""
+Tests unitaires pour le fractionnement des fichiers bruts.
+"""
+from pathlib import Path
+
+from aggregator import split_raw
+from aggregator.split_raw import split_raw_files
+
+
+def read_chunks(output_dir: Path):
+    """Renvoie le contenu des chunks produits, dans l'ordre."""
+    return [p.read_bytes() for p in sorted(output_dir.glob("chunk_*.txt"))]
+
+
+def test_split_respecte_max_lines(tmp_path):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / "data.txt").write_bytes(b"".join(b"user%d\n" % i for i in range(7)))
+
+    split_raw_files(input_dir, tmp_path / "out", max_lines=3)
+
+    assert read_chunks(tmp_path / "out") == [
+        b"user0\nuser1\nuser2\n",
+        b"user3\nuser4\nuser5\n",
+        b"user6\n",
+    ]
+
+
+def test_split_comme_lecture_texte(tmp_path, monkeypatch):
+    # Des lectures minuscules forcent les lignes à chevaucher plusieurs blocs
+    monkeypatch.setattr(split_raw, "READ_SIZE", 3)
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    # \r\n et \r deviennent \n, les octets invalides sont ignorés, la dernière ligne sans \n compte
+    (input_dir / "data.txt").write_bytes(b"a\r\nb\rc\xff\n\xc3\xa9t\xc3\xa9\nfin")
+
+    split_raw_files(input_dir, tmp_path / "out", max_lines=2)
+
+    assert read_chunks(tmp_path / "out") == [
+        b"a\nb\n",
+        "c\nété\n".encode("utf-8"),
+        b"fin",
+    ]
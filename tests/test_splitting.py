@@ -0,0 +1,66 @@
+"""
+Tests unitaires pour la division du fichier dédupliqué en chunks.
+"""
+import asyncio
+from pathlib import Path
+
+from rich.console import Console
+
+from aggregator.orchestration import splitting
+from aggregator.orchestration.splitting import SplittingMixin, _clean_block, _nth_line_end
+
+
+class DummySplitter(SplittingMixin):
+    def __init__(self, tmp_path: Path, deduped_path: Path) -> None:
+        self.output_dir = tmp_path / "output"
+        self.deduped_dir = tmp_path / "deduped"
+        self.normalized_dir = tmp_path / "normalized"
+        self.deduped_path = deduped_path
+        self.console = Console(quiet=True)
+        self.stats = {}
+
+
+def read_chunks(final_dir: Path):
+    """Renvoie le contenu des chunks produits, dans l'ordre."""
+    return [p.read_bytes() for p in sorted(final_dir.glob("chunk_*.txt"))]
+
+
+def split(tmp_path: Path, content: bytes, lines_per_file: int):
+    deduped_path = tmp_path / "deduped.txt"
+    deduped_path.write_bytes(content)
+    splitter = DummySplitter(tmp_path, deduped_path)
+    asyncio.run(splitter.run_split_deduped(auto_mode=True, lines_per_file=lines_per_file))
+    return read_chunks(tmp_path / "output" / "final")
+
+
+def test_split_deduped_blocs_minuscules(tmp_path, monkeypatch):
+    # Des lectures minuscules forcent les lignes à chevaucher plusieurs blocs
+    monkeypatch.setattr(splitting, "SPLIT_READ_SIZE", 3)
+    # Espaces retirés, \r\n et \r deviennent \n, la dernière ligne sans \n compte
+    content = "  user1 \r\nuser2\ruser3\n\tété\nuser5".encode("utf-8")
+
+    assert split(tmp_path, content, lines_per_file=2) == [
+        b"user1,\nuser2,\n",
+        "user3,\nété,\n".encode("utf-8"),
+        b"user5\n",
+    ]
+
+
+def test_split_deduped_virgule_finale(tmp_path, monkeypatch):
+    monkeypatch.setattr(splitting, "SPLIT_READ_SIZE", 4)
+    # Seul le dernier terme du fichier n'a pas de virgule, même s'il termine un chunk plein
+    assert split(tmp_path, b"a\nb\nc\nd\n", lines_per_file=2) == [b"a,\nb,\n", b"c,\nd\n"]
+
+
+def test_clean_block_chemin_rapide():
+    block = b"user1\nuser2\n"
+    assert _clean_block(block) is block
+    assert _clean_block(b" user1\nuser2\t\n") == b"user1\nuser2\n"
+
+
+def test_nth_line_end():
+    # Assez de lignes pour passer par la recherche dichotomique (intervalles > 4096 octets)
+    block = b"".join(b"%05d\n" % i for i in range(5000))
+    assert _nth_line_end(block, 1) == 6
+    assert _nth_line_end(block, 4000) == 4000 * 6
+    assert _nth_line_end(block, 10, start=6 * 100) == 6 * 110
@@ -2,39 +2,30 @@
 Tests unitaires pour les utilitaires de gestion de fichiers de données.
 """
 from pathlib import Path
-import shutil
-import os
 import pytest
 from aggregator.utils import has_valid_data_files
 
-def setup_test_dir(base, files):
-    """Crée un dossier de test avec les fichiers spécifiés."""
-    if os.path.exists(base):
-        shutil.rmtree(base)
-    os.makedirs(base)
+def setup_test_dir(base: Path, files):
+    """
+    Crée les fichiers spécifiés (vides : seule l'extension compte) dans le dossier de test
+    (créé par pytest via tmp_path).
+    """
     for fname in files:
-        with open(os.path.join(base, fname), "w", encoding="utf-8") as f:
-            f.write("test\n")
+        path = base / fname
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return base
 
-def teardown_test_dir(base):
-    if os.path.exists(base):
-        shutil.rmtree(base)
-
-def test_cache_vide():
-    base = "test_cache_vide"
-    setup_test_dir(base, [])
-    assert has_valid_data_files(Path(base), ['.txt', '.csv']) is False
-    teardown_test_dir(base)
-
-def test_cache_non_valide():
-    base = "test_cache_non_valide"
-    setup_test_dir(base, [".git", "README.md", "script.py"])
-    assert has_valid_data_files(Path(base), ['.txt', '.csv']) is False
-    teardown_test_dir(base)
-
-def test_cache_valide():
-    base = "test_cache_valide"
-    setup_test_dir(base, ["data1.txt", "data2.csv", "README.md"])
-    assert has_valid_data_files(Path(base), ['.txt', '.csv']) is True
-    teardown_test_dir(base)
+@pytest.mark.parametrize("files, expected", [
+    pytest.param([], False, id="cache_vide"),
+    pytest.param([".git", "README.md", "script.py"], False, id="cache_non_valide"),
+    pytest.param(["data1.txt", "data2.csv", "README.md"], True, id="cache_valide"),
+])
+def test_cache(tmp_path, files, expected):
+    base = setup_test_dir(tmp_path, files)
+    assert has_valid_data_files(base, ['.txt', '.csv']) is expected
 
+def test_cache_valide_sous_dossier(tmp_path):
+    base = setup_test_dir(tmp_path, [".hidden.txt", "README.md", "a/b/data.CSV"])
+    assert has_valid_data_files(base, ['.txt', '.csv']) is True
+    assert has_valid_data_files(base, ['.tsv']) is False